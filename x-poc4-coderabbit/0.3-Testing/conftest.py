@@ -10,6 +10,9 @@ Date: 2025-11-10
 Version: 1.0
 """
 
+import importlib.util
+import re
+import sys
 import pytest
 from pathlib import Path
 
@@ -469,6 +472,107 @@ def integration_env(tmp_path: Path, monkeypatch) -> dict:
     }
 
 
+# ==============================================================================
+# FIXTURE: Shipped Code (extracted from the design documents)
+# ==============================================================================
+
+DELIVERY_DIR = Path(__file__).parent.parent / "0.2-Delivery"
+PLANNING_DIR = Path(__file__).parent.parent / "0.1-Planning"
+PARSER_DOC = PLANNING_DIR / "0.1.4c-architecture-output-parser.md"
+AGGREGATOR_DOC = DELIVERY_DIR / "linter-aggregator.md"
+BIN_DIR = "/srv/cc/hana-x-infrastructure/bin"
+ROGER_DIR = "/srv/cc/hana-x-infrastructure/.claude/agents/roger"
+
+
+def extract_code_block(doc: Path, target: str, destination: Path) -> Path:
+    """
+    Write the code block following a '**File**: `target`' marker in doc to destination.
+
+    Args:
+        doc: Markdown document shipping the code
+        target: Install path named in the marker
+        destination: File to write
+
+    Returns:
+        Path: destination
+    """
+    text = doc.read_text(encoding='utf-8')
+    start = text.index(f"**File**: `{target}`")
+    match = re.compile(r"```\w*\n(.*?)\n```", re.S).search(text, start)
+    destination.write_text(match.group(1) + "\n", encoding='utf-8')
+    return destination
+
+
+def import_extracted(name: str, path: Path):
+    """
+    Import an extracted script under name (registered, so worker processes can unpickle it).
+
+    Args:
+        name: Module name
+        path: Extracted file; its directory is importable while it loads
+
+    Returns:
+        module: The imported module
+    """
+    sys.path.insert(0, str(path.parent))  # linter_aggregator imports linter_daemon
+    try:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(path.parent))
+    return module
+
+
+@pytest.fixture(scope="session")
+def shipped_bin(tmp_path_factory) -> Path:
+    """
+    The bin/ scripts shipped in the output parser document, extracted side by side.
+
+    Scope: session (extracted once)
+
+    Returns:
+        Path: Directory holding parse-coderabbit.py, json-stream.py,
+              structured-ingest.py, diff-scope.py and coderabbit-json
+    """
+    directory = tmp_path_factory.mktemp("bin")
+    for script in ("parse-coderabbit.py", "json-stream.py", "structured-ingest.py", "diff-scope.py",
+                   "coderabbit-json"):
+        extract_code_block(PARSER_DOC, f"{BIN_DIR}/{script}", directory / script)
+    return directory
+
+
+@pytest.fixture(scope="session")
+def shipped_parser(shipped_bin: Path):
+    """
+    parse-coderabbit.py as shipped, imported (siblings load from shipped_bin).
+
+    Returns:
+        module: The parser module
+    """
+    return import_extracted("shipped_parse_coderabbit", shipped_bin / "parse-coderabbit.py")
+
+
+@pytest.fixture(scope="session")
+def shipped_aggregator(tmp_path_factory, shipped_bin: Path):
+    """
+    linter_aggregator.py as shipped in linter-aggregator.md, extracted and imported.
+
+    Returns:
+        module: The aggregator module (bin/ helpers it imports point into shipped_bin)
+    """
+    directory = tmp_path_factory.mktemp("roger")
+    extract_code_block(AGGREGATOR_DOC, f"{ROGER_DIR}/linter_daemon.py", directory / "linter_daemon.py")
+    module_path = extract_code_block(AGGREGATOR_DOC, f"{ROGER_DIR}/linter_aggregator.py",
+                                     directory / "linter_aggregator.py")
+    module = import_extracted("shipped_linter_aggregator", module_path)
+    module.DIFF_SCOPE_PATH = shipped_bin / "diff-scope.py"
+    module.JSON_STREAM_PATH = shipped_bin / "json-stream.py"
+    module.STRUCTURED_INGEST_PATH = shipped_bin / "structured-ingest.py"
+    return module
+
+
 # ==============================================================================
 # PYTEST CONFIGURATION HOOKS
 # ==============================================================================
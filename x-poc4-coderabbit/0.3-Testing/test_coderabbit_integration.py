@@ -314,6 +314,108 @@ class TestCodeRabbitAPICaching:
         # Assert
         assert is_expired == should_expire
 
+    def test_packed_cache_batch_lookup_and_indexed_expiry(self, coderabbit_cache_dir: Path):
+        """
+        Test packed (SQLite WAL) backend batch lookup and TTL purge.
+
+        Given: 3 cached entries in cache.db, one already expired
+        When: All 3 keys are looked up in one batch, then expired rows purged
+        Then: 2 hits are returned and the purge deletes exactly 1 row
+        And: The purge uses the expires_at index, not a table scan
+        """
+        # Arrange
+        conn = open_packed_cache(coderabbit_cache_dir / "cache.db")
+        now = time.time()
+        keys = [hashlib.sha256(f"content {i}".encode()).hexdigest() for i in range(3)]
+        conn.executemany(
+            "INSERT INTO entries VALUES (?, ?, ?, ?, 0, 2, '{}')",
+            [(keys[0], now, now + 3600, now), (keys[1], now, now + 3600, now), (keys[2], now - 7200, now - 3600, now)]
+        )
+
+        # Act
+        hits = conn.execute(
+            f"SELECT cache_key FROM entries WHERE cache_key IN ({','.join('?' * len(keys))}) AND expires_at > ?",
+            (*keys, now)
+        ).fetchall()
+        plan = conn.execute("EXPLAIN QUERY PLAN DELETE FROM entries WHERE expires_at <= ?", (now,)).fetchall()
+        purged = conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,)).rowcount
+
+        # Assert
+        assert sorted(row[0] for row in hits) == sorted(keys[:2])
+        assert purged == 1
+        assert any("idx_entries_expires_at" in row[-1] for row in plan)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+    def test_memory_tier_evicts_by_bytes_not_entries(self):
+        """
+        Test in-process LRU tier is bounded by response bytes.
+
+        Given: A 1000-byte memory tier holding a 600-byte and a 300-byte entry
+        When: The 600-byte entry is read, then a 400-byte entry is added
+        Then: The least recently used 300-byte entry is evicted, not the larger one
+        """
+        # Arrange
+        from collections import OrderedDict
+        entries = OrderedDict()
+        lru_insert(entries, "large", 600, max_bytes=1000)
+        lru_insert(entries, "small", 300, max_bytes=1000)
+
+        # Act
+        entries.move_to_end("large")  # Cache hit
+        evicted = lru_insert(entries, "new", 400, max_bytes=1000)
+
+        # Assert
+        assert evicted == ["small"]
+        assert list(entries) == ["large", "new"]
+        assert sum(entries.values()) <= 1000
+
+    def test_single_flight_coalesces_concurrent_misses(self):
+        """
+        Test concurrent misses for the same cache key make one API call.
+
+        Given: 10 concurrent reviews miss on the same file content
+        When: Each loads through a single-flight keyed by cache key
+        Then: The API is called once and all 10 callers get its findings
+        """
+        # Arrange
+        import threading
+        inflight = {}
+        lock = threading.Lock()
+        api_calls = []
+
+        def call_api():
+            api_calls.append(1)
+            time.sleep(0.05)
+            return [{"line": 1}]
+
+        def single_flight(cache_key):
+            with lock:
+                flight = inflight.get(cache_key)
+                leader = flight is None
+                if leader:
+                    flight = inflight[cache_key] = {"event": threading.Event(), "result": None}
+            if not leader:
+                flight["event"].wait()
+                return flight["result"]
+            flight["result"] = call_api()
+            with lock:
+                del inflight[cache_key]
+            flight["event"].set()
+            return flight["result"]
+
+        # Act
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(single_flight("a1b2"))) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(api_calls) == 1
+        assert results == [[{"line": 1}]] * 10
+
 
 # ==============================================================================
 # TC-019: Rate Limit Handling
@@ -467,6 +569,59 @@ class TestRateLimitHandling:
         assert max_reviews_per_hour >= 3
         assert max_reviews_per_hour <= 4
 
+    def test_concurrent_api_calls_counted_atomically(self, coderabbit_cache_dir):
+        """
+        Test concurrent analyze_files workers never lose rate-limit increments.
+
+        Given: 8 workers each recording 25 API calls in a shared state file
+        When: Each increment is a read-modify-write under one flock
+        Then: The final count is exactly 200
+        """
+        # Arrange
+        import fcntl
+        import json
+        from concurrent.futures import ThreadPoolExecutor
+        state_file = coderabbit_cache_dir / "rate_limit.json"
+        state_file.write_text(json.dumps({'calls_made': 0}))
+
+        def record_calls(n):
+            for _ in range(n):
+                with open(state_file, 'r+') as f:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                    state = json.load(f)
+                    state['calls_made'] += 1
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(state, f)
+                    f.flush()
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(record_calls, [25] * 8))
+
+        # Assert
+        assert json.loads(state_file.read_text())['calls_made'] == 200
+
+    def test_batch_dispatch_capped_at_remaining_budget(self):
+        """
+        Test batch analysis never dispatches more calls than the budget allows.
+
+        Given: 10 uncached files and 5 calls left under the 850 buffer
+        When: The batch is planned
+        Then: 5 files are dispatched and 5 are skipped (Layer 1 results only)
+        """
+        # Arrange
+        misses = [f"src/module_{i}.py" for i in range(10)]
+        calls_made = 845
+
+        # Act
+        dispatched, skipped = plan_batch_dispatch(misses, calls_made, buffer_threshold=850)
+
+        # Assert
+        assert dispatched == misses[:5]
+        assert skipped == misses[5:]
+
 
 # ==============================================================================
 # TC-020: Network Error Handling
@@ -936,6 +1091,71 @@ def calculate_rate_limit_usage(calls_made: int, max_calls: int) -> float:
     return calls_made / max_calls if max_calls > 0 else 0.0
 
 
+def lru_insert(entries, key: str, size_bytes: int, max_bytes: int) -> list:
+    """
+    Insert into a byte-bounded LRU (OrderedDict of key -> size).
+
+    Args:
+        entries: OrderedDict in least-to-most recently used order
+        key: Cache key
+        size_bytes: Encoded response size
+        max_bytes: Tier capacity
+
+    Returns:
+        list: Evicted keys
+    """
+    entries[key] = size_bytes
+    evicted = []
+    while sum(entries.values()) > max_bytes:
+        evicted.append(entries.popitem(last=False)[0])
+    return evicted
+
+
+def open_packed_cache(db_path: Path):
+    """
+    Open a packed cache database with the Section 1.11 schema.
+
+    Args:
+        db_path: Path to cache.db
+
+    Returns:
+        sqlite3.Connection in WAL mode
+    """
+    import sqlite3
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS entries (
+            cache_key     TEXT PRIMARY KEY,
+            created_at    REAL NOT NULL,
+            expires_at    REAL NOT NULL,
+            last_accessed REAL NOT NULL,
+            hit_count     INTEGER NOT NULL DEFAULT 0,
+            size_bytes    INTEGER NOT NULL,
+            entry         TEXT NOT NULL
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_entries_expires_at ON entries (expires_at);
+        CREATE INDEX IF NOT EXISTS idx_entries_last_accessed ON entries (last_accessed);
+    """)
+    return conn
+
+
+def plan_batch_dispatch(misses: list, calls_made: int, buffer_threshold: int = 850) -> tuple:
+    """
+    Split cache misses into dispatched and skipped files by remaining budget.
+
+    Args:
+        misses: Files not found in the cache
+        calls_made: API calls already made in the current window
+        buffer_threshold: Conservative call limit (850 of 900)
+
+    Returns:
+        tuple: (dispatched, skipped) file lists
+    """
+    budget = max(0, buffer_threshold - calls_made)
+    return misses[:budget], misses[budget:]
+
+
 # ==============================================================================
 # CodeRabbit Response (2025-11-10)
 # ==============================================================================
@@ -1,5 +1,5 @@
 """
-Integration and End-to-End Tests (TC-007, TC-009 to TC-012)
+Integration and End-to-End Tests (TC-007, TC-009 to TC-012, TC-028, TC-032)
 
 Tests comprehensive integration scenarios:
 - TC-007: JSON schema compliance
@@ -7,6 +7,8 @@ Tests comprehensive integration scenarios:
 - TC-010: Pattern accuracy
 - TC-011: Edge cases
 - TC-012: CI/CD integration
+- TC-028: Benchmark regression gate (bench-suite-coderabbit.py)
+- TC-032: Streaming linter output decoding (LinterAggregator._stream_tool)
 
 Author: Julia Santos - Testing & QA Specialist
 Date: 2025-11-10
@@ -14,8 +16,16 @@ Version: 1.0
 """
 
 import pytest
+import os
+import sys
 import json
-from typing import Dict, Any
+import time
+import signal
+import threading
+import subprocess
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, TextIO
 from pathlib import Path
 
 
@@ -596,6 +606,166 @@ class TestCICDIntegration:
         pass
 
 
+# ==============================================================================
+# TC-028: Benchmark Regression Gate
+# ==============================================================================
+
+@pytest.mark.unit
+class TestBenchmarkRegressionGate:
+    """
+    TC-028: Verify the benchmark suite's baseline comparison.
+
+    Throughput may not drop, and emit time and peak RSS may not grow, by
+    more than the threshold; timings too short to be stable are not gated.
+    """
+
+    @pytest.fixture
+    def baseline(self) -> Dict[str, Dict]:
+        """Baseline for one 100k-issue case."""
+        return {
+            "pylint/100k": {"parse_seconds": 0.93, "issues_per_second": 107060,
+                            "emit_seconds": 0.38, "peak_rss_mb": 164.0},
+        }
+
+    def test_change_within_threshold_passes(self, baseline: Dict[str, Dict]):
+        """
+        Test normal run-to-run noise does not fail the suite.
+
+        Given: A run 10% slower than baseline
+        When: Compared with a 20% threshold
+        Then: No regressions are reported
+        """
+        # Arrange
+        current = {"pylint/100k": {"parse_seconds": 1.02, "issues_per_second": 97330,
+                                   "emit_seconds": 0.41, "peak_rss_mb": 170.0}}
+
+        # Act & Assert
+        assert find_regressions(baseline, current, threshold=0.20) == []
+
+    def test_throughput_drop_and_memory_growth_fail(self, baseline: Dict[str, Dict]):
+        """
+        Test regressions are reported in the metric's own direction.
+
+        Given: Half the throughput and double the peak RSS
+        When: Compared with a 20% threshold
+        Then: issues/s and peak RSS are reported; unchanged emit time is not
+        """
+        # Arrange
+        current = {"pylint/100k": {"parse_seconds": 1.86, "issues_per_second": 53530,
+                                   "emit_seconds": 0.38, "peak_rss_mb": 328.0}}
+
+        # Act
+        regressions = find_regressions(baseline, current, threshold=0.20)
+
+        # Assert
+        assert regressions == ["pylint/100k issues_per_second", "pylint/100k peak_rss_mb"]
+
+    def test_short_timings_and_new_cases_not_gated(self, baseline: Dict[str, Dict]):
+        """
+        Test noisy and unrecorded cases cannot fail the run.
+
+        Given: A 10 ms case far slower than baseline, and a case with no baseline
+        When: Compared with a 20% threshold
+        Then: Neither is reported
+        """
+        # Arrange
+        baseline["mypy/1k"] = {"parse_seconds": 0.005, "issues_per_second": 200000,
+                               "emit_seconds": 0.004, "peak_rss_mb": 24.0}
+        current = {
+            "mypy/1k": {"parse_seconds": 0.01, "issues_per_second": 100000,
+                        "emit_seconds": 0.008, "peak_rss_mb": 24.0},
+            "radon/1m": {"parse_seconds": 30.0, "issues_per_second": 33000,
+                         "emit_seconds": 4.0, "peak_rss_mb": 3000.0},
+        }
+
+        # Act & Assert
+        assert find_regressions(baseline, current, threshold=0.20) == []
+
+
+# ==============================================================================
+# TC-032: Streaming Linter Output Decoding
+# ==============================================================================
+
+@pytest.mark.integration
+class TestStreamingLinterDecoding:
+    """
+    TC-032: Verify linter output is decoded from the pipe while the linter runs.
+
+    stderr is drained concurrently, findings are decoded one at a time, and a
+    timeout kills the linter's whole process group.
+    """
+
+    def test_chatty_stderr_does_not_block_stdout(self):
+        """
+        Test a linter writing more stderr than a pipe holds does not deadlock.
+
+        Given: A child writing 20,000 stderr lines before its JSON findings
+        When: Its stdout is decoded through the streaming runner
+        Then: All findings are decoded and only the stderr tail is kept
+        """
+        # Arrange
+        script = ("import sys\n"
+                  "for i in range(20000): print('progress', i, file=sys.stderr)\n"
+                  "print('[{\"id\": 1}, {\"id\": 2}, {\"id\": 3}]')\n")
+
+        # Act
+        with stream_tool([sys.executable, "-c", script], timeout=30) as (stdout, stderr_tail):
+            records = list(iter_json_array(stdout))
+
+        # Assert
+        assert [record["id"] for record in records] == [1, 2, 3]
+        assert len(stderr_tail) == 20
+        assert stderr_tail[-1].strip() == "progress 19999"
+
+    def test_findings_decoded_before_linter_exits(self):
+        """
+        Test the first finding is available while the linter is still running.
+
+        Given: A child that writes one finding, then waits on its stdin
+        When: The first record is read from the stream
+        Then: It is decoded before the child is allowed to finish
+        """
+        # Arrange
+        script = ("import sys\n"
+                  "sys.stdout.write('[{\"id\": 1}'); sys.stdout.flush()\n"
+                  "sys.stdin.read()\n"
+                  "sys.stdout.write(', {\"id\": 2}]')\n")
+        read_fd, write_fd = os.pipe()
+
+        # Act
+        with stream_tool([sys.executable, "-c", script], timeout=30, stdin=read_fd) as (stdout, _):
+            os.close(read_fd)
+            records = iter_json_array(stdout)
+            first = next(records)
+            os.close(write_fd)  # Only now may the child finish
+            rest = list(records)
+
+        # Assert
+        assert first == {"id": 1}
+        assert rest == [{"id": 2}]
+
+    def test_timeout_kills_workers_holding_the_pipe(self):
+        """
+        Test a timeout is not stalled by a worker that inherited stdout.
+
+        Given: A child that spawns a 30 s worker sharing its stdout, then hangs
+        When: The streaming runner's 1 s timeout expires
+        Then: TimeoutExpired is raised within a few seconds, not after 30 s
+        """
+        # Arrange
+        script = ("import subprocess, sys, time\n"
+                  "subprocess.Popen(['sleep', '30'])\n"
+                  "sys.stdout.write('[{\"id\": 1}'); sys.stdout.flush()\n"
+                  "time.sleep(30)\n")
+        start = time.monotonic()
+
+        # Act & Assert
+        with pytest.raises(subprocess.TimeoutExpired):
+            with stream_tool([sys.executable, "-c", script], timeout=1) as (stdout, _):
+                list(iter_json_array(stdout))
+        assert time.monotonic() - start < 10
+
+
 # ==============================================================================
 # Helper Functions for Integration Testing
 # ==============================================================================
@@ -654,3 +824,123 @@ def get_exit_code(result: Dict) -> int:
     if result.get("critical_issues", 0) > 0:
         return 1
     return 0
+
+
+def find_regressions(baseline: Dict[str, Dict], current: Dict[str, Dict], threshold: float) -> List[str]:
+    """
+    Compare benchmark results with a baseline (bench-suite-coderabbit.py rule).
+
+    Args:
+        baseline: Case name → recorded metrics
+        current: Case name → metrics from this run
+        threshold: Allowed relative regression (0.20 = 20%)
+
+    Returns:
+        list: "<case> <metric>" for every metric worse than the threshold
+    """
+    directions = {"issues_per_second": 1, "emit_seconds": -1, "peak_rss_mb": -1}
+    regressions = []
+    for case, metrics in current.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+        for metric, direction in directions.items():
+            timed = metrics["emit_seconds"] if metric == "emit_seconds" else metrics["parse_seconds"]
+            if metric != "peak_rss_mb" and timed < 0.05:
+                continue
+            change = (metrics[metric] - base[metric]) / base[metric]
+            if change * direction < -threshold:
+                regressions.append(f"{case} {metric}")
+    return regressions
+
+
+@contextmanager
+def stream_tool(cmd: List[str], timeout: float, stdin: Any = None) -> Iterator:
+    """
+    Run a command and yield its stdout pipe (LinterAggregator._stream_tool rule).
+
+    Args:
+        cmd: Command to run
+        timeout: Seconds before the command's process group is killed
+        stdin: Optional stdin for the command
+
+    Yields:
+        tuple: (stdout stream, deque with the last 20 stderr lines)
+    """
+    process = subprocess.Popen(cmd, stdin=stdin, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               text=True, start_new_session=True)
+
+    def kill():
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    stderr_tail = deque(maxlen=20)
+    drain = threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+    drain.start()
+    watchdog = threading.Timer(timeout, kill)
+    watchdog.start()
+    start = time.monotonic()
+    failure = None
+    try:
+        yield process.stdout, stderr_tail
+        while process.stdout.read(64 * 1024):
+            pass
+    except BaseException as e:
+        failure = e
+        kill()
+    finally:
+        process.wait()
+        watchdog.cancel()
+        drain.join()
+        process.stdout.close()
+        process.stderr.close()
+    if time.monotonic() - start >= timeout:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if failure is not None:
+        raise failure
+
+
+def iter_json_array(stream: TextIO) -> Iterator[Any]:
+    """
+    Decode the elements of a JSON array one at a time from a stream.
+
+    Args:
+        stream: Text stream holding one JSON array
+
+    Yields:
+        Each element as soon as it has been read completely
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos = "", 0
+    expect = "["
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n":
+            pos += 1
+        if pos == len(buffer):
+            chunk = stream.read(1)
+            if not chunk:
+                raise ValueError("truncated JSON array")
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        if expect:
+            if buffer[pos] not in expect:
+                raise ValueError(f"expected {expect!r}, got {buffer[pos]!r}")
+            char = buffer[pos]
+            pos += 1
+            if char == "]":
+                return
+            expect = None
+            continue
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            chunk = stream.read(1)
+            if not chunk:
+                raise
+            buffer += chunk
+            continue
+        pos = end
+        expect = ",]"
+        yield value
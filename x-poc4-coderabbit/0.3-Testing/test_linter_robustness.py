@@ -8,6 +8,17 @@ Covers:
 - TC-015: Linter version validation
 - TC-016: Parallel linter execution
 - TC-017: Issue deduplication
+- TC-023: Incremental linting result cache
+- TC-033: Structured mypy output decoding (MypyBackend)
+- TC-034: File-sharded pylint/bandit execution
+- TC-035: Run-history cost model (LPT scheduling, slow files)
+- TC-036: Indexed issue store and index-based dedup
+- TC-037: Test-impact-aware coverage (selection, merge, totals)
+- TC-038: Per-file black findings from black's unified diff
+- TC-039: Shared AST cache and Hana-X convention checks
+- TC-040: Shipped LinterAggregator: cross-file findings (warm cache, shards)
+- TC-041: Shared --jobs budget for linters, shards and the black pool (CpuBudget)
+- TC-043: Shipped run_all(): issues emitted while later linters still run
 
 Author: Julia Santos - Testing & QA Specialist
 Based on: ERIC-LINTER-REVIEW.md
@@ -15,12 +26,21 @@ Date: 2025-11-10
 Version: 1.0
 """
 
+import ast
 import pytest
 import subprocess
+import hashlib
+import heapq
 import json
+import os
 import re
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from unittest.mock import Mock, patch, MagicMock
 from packaging import version
 
@@ -430,42 +450,75 @@ class TestParallelLinterExecution:
 
     Per Eric's review (Section 5.3):
     - Use ThreadPoolExecutor for parallel execution
-    - 6 workers (one per linter)
-    - 3x performance improvement
+    - Workers bounded by a CPU budget (--jobs, default: CPU count)
+    - Each linter fills its own issue list; lists merged in report order
     - All results collected correctly
     """
 
     def test_parallel_execution_structure(self):
         """
-        Test parallel execution uses ThreadPoolExecutor.
+        Test concurrent linters never exceed the CPU budget.
 
-        Given: Linter aggregator with 6 linters
+        Given: 6 linters and a budget of 2 jobs
         When: run_all() executes
-        Then: ThreadPoolExecutor with max_workers=6 used
+        Then: At most 2 linters run at the same time
         """
-        # This test validates the structure
-        # Actual implementation will use concurrent.futures
-        from concurrent.futures import ThreadPoolExecutor
-
         # Arrange
-        max_workers = 6
+        lock = threading.Lock()
+        state = {'running': 0, 'peak': 0}
+
+        def make_linter(name):
+            def linter():
+                with lock:
+                    state['running'] += 1
+                    state['peak'] = max(state['peak'], state['running'])
+                time.sleep(0.05)
+                with lock:
+                    state['running'] -= 1
+                return [f"{name} issue"]
+            return linter
+
+        linters = [(name, make_linter(name)) for name in LINTER_ORDER]
 
         # Act
-        executor = ThreadPoolExecutor(max_workers=max_workers)
+        results, _ = run_linters_concurrently(linters, jobs=2)
 
         # Assert
-        assert executor._max_workers == max_workers
+        assert state['peak'] == 2
+        assert len(results) == 6
 
     def test_all_linter_results_collected(self):
         """
         Test all linter results are collected after parallel execution.
 
-        Given: 6 linters run in parallel
-        When: All futures complete
-        Then: All linter results are aggregated
+        Given: 6 linters run in parallel, finishing in reverse order
+        When: Per-linter issue lists are merged
+        Then: IDs follow report order, same as sequential execution
         """
-        # This test validates result collection logic
-        pass
+        # Arrange
+        prefixes = {'bandit': 'BAN', 'pylint': 'PYL', 'mypy': 'MYP',
+                    'radon': 'RAD', 'black': 'BLK', 'pytest': 'COV'}
+
+        def make_linter(index):
+            def linter():
+                time.sleep(0.01 * (len(LINTER_ORDER) - index))  # Last linter finishes first
+                return [{'source': LINTER_ORDER[index]}]
+            return linter
+
+        linters = [(name, make_linter(index)) for index, name in enumerate(LINTER_ORDER)]
+
+        # Act
+        results, _ = run_linters_concurrently(linters, jobs=6)
+        merged = []
+        for name in LINTER_ORDER:
+            for issue in results[name]:
+                issue['id'] = f"{prefixes[name]}-{len(merged) + 1:03d}"
+                merged.append(issue)
+
+        # Assert
+        assert [issue['id'] for issue in merged] == [
+            'BAN-001', 'PYL-002', 'MYP-003', 'RAD-004', 'BLK-005', 'COV-006'
+        ]
 
     def test_parallel_execution_error_isolation(self):
         """
@@ -473,27 +526,67 @@ class TestParallelLinterExecution:
 
         Given: One linter fails during parallel execution
         When: Other linters complete successfully
-        Then: Failed linter logged, successful results collected
+        Then: Failed linter excluded, successful results collected
 
         Rationale: Graceful degradation principle
         """
-        # This test validates error isolation
-        pass
+        # Arrange
+        def failing_linter():
+            raise subprocess.TimeoutExpired(['mypy'], 60)
+
+        linters = [
+            ('bandit', lambda: ['B105']),
+            ('mypy', failing_linter),
+            ('black', lambda: []),
+        ]
+
+        # Act
+        results, failures = run_linters_concurrently(linters, jobs=3)
+
+        # Assert
+        assert results == {'bandit': ['B105'], 'black': []}
+        assert list(failures) == ['mypy']
 
     def test_sequential_vs_parallel_performance_concept(self):
         """
-        Test documents performance improvement concept.
+        Test wall-clock time is the slowest linter, not the sum.
+
+        Sequential: sum of all linters (6 x 0.1s = 0.6s)
+        Parallel: max of slowest linter (~0.1s)
+        Improvement: up to 6x for I/O-bound linters
+        """
+        # Arrange
+        linters = [(name, lambda: time.sleep(0.1) or []) for name in LINTER_ORDER]
+
+        # Act
+        start = time.perf_counter()
+        run_linters_concurrently(linters, jobs=6)
+        parallel_time = time.perf_counter() - start
+
+        # Assert
+        sequential_time = 0.1 * len(linters)
+        assert sequential_time / parallel_time >= 2.5  # At least 2.5x improvement
+
+    def test_per_linter_cpu_time_from_wait4(self):
+        """
+        Test CPU time is measured per child process.
+
+        Given: A CPU-bound child process
+        When: It is reaped with os.wait4
+        Then: Its own user + system time is reported
 
-        Sequential: ~120 seconds (sum of all linters)
-        Parallel: ~40 seconds (max of slowest linter)
-        Improvement: ~3x faster
+        Rationale: RUSAGE_CHILDREN deltas mix concurrent linters together
         """
-        # This test documents expected performance gain
-        sequential_time = 120  # seconds
-        parallel_time = 40     # seconds
-        improvement = sequential_time / parallel_time
+        # Arrange
+        process = subprocess.Popen([sys.executable, '-c', 'sum(range(3_000_000))'])
+
+        # Act
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
 
-        assert improvement >= 2.5  # At least 2.5x improvement
+        # Assert
+        assert process.returncode == 0
+        assert usage.ru_utime + usage.ru_stime > 0
 
 
 # ==============================================================================
@@ -676,57 +769,1569 @@ class TestIssueDeduplication:
 
 
 # ==============================================================================
-# Helper Functions
+# TC-023: Incremental Linting Result Cache
 # ==============================================================================
 
-def parse_version(version_string: str) -> tuple:
+@pytest.mark.unit
+@pytest.mark.linter
+class TestIncrementalLintCache:
     """
-    DEPRECATED: Use packaging.version.parse() instead.
-    
-    Legacy simple parser that only handles numeric versions.
-    Kept for backward compatibility but not used.
+    TC-023: Verify per-file linter result cache keys.
 
-    Args:
-        version_string: Version string like "1.7.5"
+    Key = SHA-256(format version, linter, linter version, config hash,
+    relative path, SHA-256 of content) - same content hash as Layer 3
+    generate_cache_key, sharded as <key[:2]>/<key[2:4]>/<key>.json
+    """
 
-    Returns:
-        tuple: Version tuple like (1, 7, 5)
+    BASE = {
+        'linter': 'bandit',
+        'version': 'bandit 1.7.5',
+        'config_hash': hashlib.sha256(b'[bandit]').hexdigest(),
+        'rel_path': 'src/auth.py',
+        'content': b'password = "hunter2"\n',
+    }
+
+    @pytest.mark.parametrize("field,changed_value", [
+        ('linter', 'radon'),
+        ('version', 'bandit 1.7.6'),
+        ('config_hash', hashlib.sha256(b'[bandit]\nskips = B101').hexdigest()),
+        ('rel_path', 'src/user.py'),
+        ('content', b'password = os.environ["PASSWORD"]\n'),
+    ])
+    def test_key_invalidated_by_each_component(self, field: str, changed_value):
+        """
+        Test any key component change produces a cache miss.
+
+        Given: A cached result for bandit on src/auth.py
+        When: Linter, version, config, path or content changes
+        Then: Cache key differs
+        """
+        # Arrange
+        changed = {**self.BASE, field: changed_value}
+
+        # Act & Assert
+        assert lint_cache_key(**changed) != lint_cache_key(**self.BASE)
+
+    def test_reverted_content_hits_cache(self):
+        """
+        Test reverting a file restores the original cache key.
+
+        Given: File edited, then edit reverted (git checkout)
+        When: Key recomputed
+        Then: Same key as before the edit (warm hit)
+        """
+        # Arrange
+        original_key = lint_cache_key(**self.BASE)
+        lint_cache_key(**{**self.BASE, 'content': b'x = 1\n'})
+
+        # Act
+        reverted_key = lint_cache_key(**self.BASE)
+
+        # Assert
+        assert reverted_key == original_key
+
+    def test_clean_file_cached_as_empty_list(self, tmp_path: Path):
+        """
+        Test files with no findings are cached, not re-linted.
+
+        Given: Linter found no issues in a file
+        When: Result stored and looked up
+        Then: Lookup returns [] (hit), distinct from None (miss)
+        """
+        # Arrange
+        key = lint_cache_key(**self.BASE)
+        cache_path = tmp_path / key[:2] / key[2:4] / f"{key}.json"
+        cache_path.parent.mkdir(parents=True)
+
+        # Act
+        cache_path.write_text(json.dumps({'cache_key': key, 'issues': []}))
+        cached = json.loads(cache_path.read_text())['issues']
+
+        # Assert
+        assert cached == []
+        assert cached is not None
+
+
+# ==============================================================================
+# TC-033: Structured Mypy Output Decoding
+# ==============================================================================
+
+@pytest.mark.unit
+@pytest.mark.linter
+class TestMypyStructuredOutput:
     """
-    return tuple(map(int, version_string.split('.')))
+    TC-033: Verify MypyBackend decodes mypy JSON and text output alike.
 
+    JSON lines (mypy >= 1.11, --output json) and the text fallback yield the
+    same error records; notes are folded into the preceding error's hint.
+    """
 
-def compare_versions(version1: str, version2: str) -> int:
+    def test_json_and_text_decode_identically(self):
+        """
+        Test both output formats produce the same error record.
+
+        Given: One error with a note, as JSON (0-based column) and as text
+        When: Each is decoded
+        Then: File, line, 1-based column, code and hint are identical
+        """
+        # Arrange
+        json_lines = [json.dumps({
+            "file": "src/auth.py", "line": 42, "column": 14, "message": "Missing return statement",
+            "hint": "Consider a cast", "code": "return", "severity": "error",
+        })]
+        text_lines = [
+            "src/auth.py:42:15: error: Missing return statement  [return]",
+            "src/auth.py:42:15: note: Consider a cast",
+        ]
+
+        # Act
+        from_json = decode_mypy_errors(json_lines)
+        from_text = decode_mypy_errors(text_lines)
+
+        # Assert
+        assert from_json == from_text == [{
+            "file": "src/auth.py", "line": 42, "column": 15, "message": "Missing return statement",
+            "code": "return", "hint": "Consider a cast",
+        }]
+
+    def test_windows_paths_and_file_level_errors(self):
+        """
+        Test paths containing colons and errors without a line number.
+
+        Given: A Windows drive-letter path, and a file-level error (no line)
+        When: Text output is decoded
+        Then: The full path is kept and the missing line becomes None
+        """
+        # Arrange
+        text_lines = [
+            r'C:\src\app\auth.py:7:1: error: Name "x" is not defined  [name-defined]',
+            'src/a.py: error: Source file found twice under different module names',
+        ]
+
+        # Act
+        errors = decode_mypy_errors(text_lines)
+
+        # Assert
+        assert errors[0]["file"] == r"C:\src\app\auth.py"
+        assert (errors[0]["line"], errors[0]["column"]) == (7, 1)
+        assert errors[1]["file"] == "src/a.py"
+        assert errors[1]["line"] is None
+
+    def test_summary_and_standalone_notes_ignored(self):
+        """
+        Test non-error lines produce no findings.
+
+        Given: A note for another file, a summary line and dmypy status output
+        When: Decoded after one error
+        Then: Only the error is returned, without the unrelated note
+        """
+        # Arrange
+        text_lines = [
+            "Daemon started",
+            "src/a.py:3:5: error: Incompatible return value type  [return-value]",
+            "src/b.py:9: note: Revealed type is \"builtins.int\"",
+            "Found 1 error in 1 file (checked 12 source files)",
+        ]
+
+        # Act
+        errors = decode_mypy_errors(text_lines)
+
+        # Assert
+        assert [error["file"] for error in errors] == ["src/a.py"]
+        assert errors[0]["hint"] is None
+
+
+# ==============================================================================
+# TC-034: File-Sharded Linter Execution
+# ==============================================================================
+
+@pytest.mark.unit
+@pytest.mark.linter
+class TestShardedLinterExecution:
     """
-    Compare two version strings using PEP 440 compliant parsing.
-    
-    Handles complex versions including:
-    - Pre-releases: 1.0.0a1, 1.0.0b2, 1.0.0rc1
-    - Post-releases: 1.0.0.post1
-    - Dev releases: 1.0.0.dev1
-    - Local versions: 1.0.0+local.version
-    
-    Args:
-        version1: First version string (e.g., "1.7.5", "0.900a1")
-        version2: Second version string (e.g., "1.7.6", "0.900")
+    TC-034: Verify pylint/bandit file sharding.
 
-    Returns:
-        int: -1 if v1 < v2, 0 if equal, 1 if v1 > v2
-        
-    Examples:
-        >>> compare_versions("1.0.0", "1.0.1")
-        -1
-        >>> compare_versions("1.0.0", "1.0.0")
-        0
-        >>> compare_versions("1.0.0", "1.0.0a1")
-        1
-        >>> compare_versions("0.900", "0.910")
-        -1
+    Files are split into shards of similar size (largest first onto the
+    lightest shard); shard results are merged in file order whatever order
+    the shards finish in.
     """
-    v1 = version.parse(version1)
-    v2 = version.parse(version2)
 
-    if v1 < v2:
-        return -1
-    elif v1 > v2:
-        return 1
-    return 0
+    def test_shards_balanced_by_size(self):
+        """
+        Test shard loads stay within one file of the average.
+
+        Given: 40 files of very different sizes
+        When: Partitioned into 4 shards
+        Then: Every file is in exactly one shard and no shard exceeds avg + largest file
+        """
+        # Arrange
+        sizes = {f"src/m{index}.py": (index * 7919) % 50000 + 200 for index in range(40)}
+
+        # Act
+        shards = partition_files(sizes, count=4)
+
+        # Assert
+        assert sorted(path for shard in shards for path in shard) == sorted(sizes)
+        loads = [sum(sizes[path] for path in shard) for shard in shards]
+        assert max(loads) <= sum(loads) / 4 + max(sizes.values())
+
+    def test_shards_keep_original_file_order(self):
+        """
+        Test each shard lists its files in the tree's order.
+
+        Given: Files in sorted order
+        When: Partitioned
+        Then: Each shard is a subsequence of the original order (stable command lines)
+        """
+        # Arrange
+        files = {f"src/m{index:02d}.py": 1000 + index for index in range(12)}
+        order = list(files)
+
+        # Act
+        shards = partition_files(files, count=3)
+
+        # Assert
+        for shard in shards:
+            assert shard == [path for path in order if path in shard]
+
+    def test_merge_independent_of_finish_order(self):
+        """
+        Test merged issues do not depend on which shard finished first.
+
+        Given: Two shards' issue lists, delivered in either order
+        When: Merged by file position
+        Then: Both orders give the same list, each file's issues in linter order
+        """
+        # Arrange
+        files = ["src/a.py", "src/b.py", "src/c.py"]
+        shard_1 = [("src/b.py", 9), ("src/b.py", 3)]
+        shard_2 = [("src/a.py", 5), ("src/c.py", 1)]
+
+        # Act
+        forward = merge_shard_issues(files, [shard_1, shard_2])
+        reverse = merge_shard_issues(files, [shard_2, shard_1])
+
+        # Assert
+        assert forward == reverse == [("src/a.py", 5), ("src/b.py", 9), ("src/b.py", 3), ("src/c.py", 1)]
+
+    @pytest.mark.parametrize("cores,memory_mb,files,expected", [
+        (8, 16000, 2000, 8),   # Core-bound
+        (8, 1500, 2000, 3),    # Memory-bound: 1500 MB / 500 MB per pylint process
+        (8, 16000, 250, 2),    # Too few files for more shards
+        (1, 16000, 2000, 1),   # Single core: one process, as before
+    ])
+    def test_shard_count_from_cores_and_memory(self, cores: int, memory_mb: int, files: int, expected: int):
+        """
+        Test pylint's shard count respects cores, memory budget and minimum shard size.
+
+        Args:
+            cores: Usable CPU cores
+            memory_mb: Memory budget for shard processes
+            files: Python files to lint
+            expected: Expected shard count
+        """
+        # Act & Assert
+        assert shard_count(cores, memory_mb, process_mb=500, files=files) == expected
+
+
+# ==============================================================================
+# TC-035: Run-History Cost Model
+# ==============================================================================
+
+@pytest.mark.unit
+@pytest.mark.linter
+class TestLintCostModel:
+    """
+    TC-035: Verify LintCostModel scheduling and slow-file detection.
+
+    Linters are submitted longest predicted first; a process's CPU time is
+    split over its files by their history, and only edited files can be
+    flagged as slow.
+    """
+
+    def test_lpt_order_beats_timeout_order(self):
+        """
+        Test predicted-cost order shortens the makespan on uneven linters.
+
+        Given: pytest has the longest timeout but is fast; mypy and bandit are slow
+        When: The six linters run on 2 workers, in timeout order vs predicted order
+        Then: LPT finishes at 45s (optimal here) instead of 50s
+        """
+        # Arrange
+        timeouts = {'pytest': 300, 'pylint': 120, 'bandit': 60, 'mypy': 60, 'radon': 30, 'black': 30}
+        seconds = {'pytest': 5, 'pylint': 30, 'bandit': 20, 'mypy': 25, 'radon': 2, 'black': 1}
+
+        # Act
+        by_timeout = schedule_makespan([seconds[name] for name in sorted(timeouts, key=timeouts.get, reverse=True)], 2)
+        by_prediction = schedule_makespan(sorted(seconds.values(), reverse=True), 2)
+
+        # Assert
+        assert by_timeout == 50
+        assert by_prediction == 45
+
+    def test_process_time_split_by_history(self):
+        """
+        Test a process's work is shared in proportion to each file's usual cost.
+
+        Given: Files usually taking 1s and 3s, no edits
+        When: The process spends 8s beyond start-up
+        Then: The files are attributed 2s and 6s, and nothing is flagged
+        """
+        # Act
+        seconds, flagged = attribute_process(cpu_seconds=8.5, startup=0.5, usual={'a.py': 1.0, 'b.py': 3.0}, changed=[])
+
+        # Assert
+        assert seconds == {'a.py': 2.0, 'b.py': 6.0}
+        assert flagged == []
+
+    def test_excess_goes_to_edited_file(self):
+        """
+        Test a much slower process blames the edited file only.
+
+        Given: Three files usually taking 1s each; c.py was edited
+        When: The process takes 12.5s CPU instead of the predicted 3.5s
+        Then: a.py and b.py keep 1s, c.py gets the other 10s and is flagged
+        """
+        # Act
+        seconds, flagged = attribute_process(cpu_seconds=12.5, startup=0.5,
+                                             usual={'a.py': 1.0, 'b.py': 1.0, 'c.py': 1.0}, changed=['c.py'])
+
+        # Assert
+        assert seconds == {'a.py': 1.0, 'b.py': 1.0, 'c.py': 10.0}
+        assert flagged == ['c.py']
+
+    @pytest.mark.parametrize("cpu_seconds,changed", [
+        (12.5, []),          # Much slower, but no file changed: cause unknown
+        (4.5, ['c.py']),     # Edited file, but within 2s of the prediction
+    ])
+    def test_no_flag_without_cause(self, cpu_seconds: float, changed: List[str]):
+        """
+        Test unexplained or small slowdowns flag nothing.
+
+        Args:
+            cpu_seconds: Process CPU time (prediction: 3.5s)
+            changed: Files edited since their last run
+        """
+        # Act
+        _, flagged = attribute_process(cpu_seconds=cpu_seconds, startup=0.5,
+                                       usual={'a.py': 1.0, 'b.py': 1.0, 'c.py': 1.0}, changed=changed)
+
+        # Assert
+        assert flagged == []
+
+    def test_fit_recovers_startup_and_rate(self):
+        """
+        Test the decayed least-squares fit separates start-up from per-byte cost.
+
+        Given: Processes whose CPU time is 0.5s + 2e-5 s/byte, over varying sizes
+        When: Fitted from decayed sums
+        Then: Start-up and seconds per byte are recovered
+        """
+        # Arrange
+        samples = [(size, 0.5 + 2e-5 * size) for size in (10_000, 400_000, 50_000, 1_200_000, 250_000)]
+
+        # Act
+        startup, per_byte = fit_process_cost(samples, prior_startup=0.4)
+
+        # Assert
+        assert startup == pytest.approx(0.5)
+        assert per_byte == pytest.approx(2e-5)
+
+
+# ==============================================================================
+# TC-036: Indexed Issue Store
+# ==============================================================================
+
+@pytest.mark.unit
+@pytest.mark.linter
+class TestIssueStore:
+    """
+    TC-036: Verify IssueStore indexes and index-based Layer 1/Layer 3 dedup.
+
+    Counters and per-field indexes are updated on insert, so aggregation
+    reads them instead of rescanning the issue list.
+    """
+
+    def test_index_counts_match_full_scans(self):
+        """
+        Test indexed counts equal the old per-priority/per-category list scans.
+
+        Given: 500 issues with mixed priorities and categories
+        When: Indexed on insert
+        Then: Every group count equals a full-scan count
+        """
+        # Arrange
+        issues = [
+            {'file': f"src/m{index % 7}.py", 'line': index % 40, 'source': 'pylint',
+             'priority': f"P{index % 4}", 'category': ['security', 'quality', 'types'][index % 3]}
+            for index in range(500)
+        ]
+
+        # Act
+        indexes = index_issues(issues)
+
+        # Assert
+        for field in ('priority', 'category'):
+            counts = {value: len(group) for value, group in indexes[field].items()}
+            for value in counts:
+                assert counts[value] == len([issue for issue in issues if issue[field] == value])
+
+    def test_top_n_by_priority(self):
+        """
+        Test top-N returns the most severe issues, report order within a priority.
+
+        Given: Issues P2, P0, P1, P0, P3 in report order
+        When: The top 3 are requested
+        Then: Both P0 issues (in order) and then the P1 issue
+        """
+        # Arrange
+        issues = [{'file': 'a.py', 'line': index, 'source': 'pylint', 'category': 'quality', 'priority': priority}
+                  for index, priority in enumerate(['P2', 'P0', 'P1', 'P0', 'P3'])]
+
+        # Act
+        top = top_n_by_priority(index_issues(issues), 3)
+
+        # Assert
+        assert [(issue['priority'], issue['line']) for issue in top] == [('P0', 1), ('P0', 3), ('P1', 2)]
+
+    def test_relative_and_absolute_paths_meet(self, tmp_path, monkeypatch):
+        """
+        Test by-file lookups match a file however the linter spelled its path.
+
+        Given: One linter reports 'src/x.py', another '<cwd>/src/x.py'
+        When: Indexed by absolute path
+        Then: Both issues are found under the same file
+        """
+        # Arrange
+        monkeypatch.chdir(tmp_path)
+        issues = [
+            {'file': 'src/x.py', 'line': 1, 'source': 'pylint', 'category': 'quality', 'priority': 'P2'},
+            {'file': str(tmp_path / 'src' / 'x.py'), 'line': 3, 'source': 'mypy', 'category': 'types', 'priority': 'P1'},
+        ]
+
+        # Act
+        indexes = index_issues(issues)
+
+        # Assert
+        assert len(indexes['file'][os.path.abspath('src/x.py')]) == 2
+
+    def test_indexed_dedup_precedence(self):
+        """
+        Test location-indexed dedup keeps the Layer 1 precedence rules.
+
+        Given: Layer 1 findings and Layer 3 findings (a duplicate, a complementary one, a new one)
+        When: Deduplicated with fingerprint and location indexes
+        Then: The duplicate is suppressed and only the complementary finding is marked
+        """
+        # Arrange
+        layer1 = [{'file': 'auth.py', 'line': 42, 'category': 'security', 'severity': 'high'},
+                  {'file': 'auth.py', 'line': 50, 'category': 'types', 'severity': 'high'}]
+        layer3 = [{'file': 'auth.py', 'line': 42, 'category': 'security', 'severity': 'high'},
+                  {'file': 'auth.py', 'line': 50, 'category': 'security', 'severity': 'medium'},
+                  {'file': 'user.py', 'line': 7, 'category': 'architecture', 'severity': 'low'}]
+
+        # Act
+        kept = deduplicate_with_indexes(layer1, layer3)
+
+        # Assert
+        assert [(finding['file'], finding['line']) for finding in kept] == [('auth.py', 50), ('user.py', 7)]
+        assert [finding.get('complementary_to_layer1', False) for finding in kept] == [True, False]
+
+
+# ==============================================================================
+# TC-037: Test-Impact-Aware Coverage
+# ==============================================================================
+
+@pytest.mark.unit
+@pytest.mark.linter
+class TestCoverageImpact:
+    """
+    TC-037: Verify the shipped CoverageImpact test selection, merge and totals.
+
+    Only tests whose contexts cover a changed file re-run; their old data is
+    replaced by the fresh measurement, so totals match a full run.
+    """
+
+    def test_selects_tests_covering_changed_file(self, shipped_aggregator, tmp_path: Path):
+        """
+        Test a changed source file selects the node IDs of its contexts.
+
+        Given: A stored map where a.py is covered by test_a.py::test_f and test_mix.py::test_both
+        When: a.py changes
+        Then: Exactly those two node IDs are selected and a.py's data is stale
+        """
+        # Arrange
+        project = coverage_project(tmp_path / "project")
+        impact_total(shipped_aggregator, project, tmp_path / "impact")
+        a_py = project / "src" / "pkg" / "a.py"
+        a_py.write_text(a_py.read_text() + "# edited\n")
+
+        # Act
+        plan = impact_plan(shipped_aggregator, project, tmp_path / "impact")
+
+        # Assert
+        assert not plan.full
+        assert plan.tests == ['tests/test_a.py::test_f', 'tests/test_mix.py::test_both']
+        assert plan.stale_files == [str(a_py.resolve())]
+
+    def test_changed_test_file_runs_whole(self, shipped_aggregator, tmp_path: Path):
+        """
+        Test a changed test file is run as a file, not by its old node IDs.
+
+        Given: tests/test_b.py edited (it now holds a new test)
+        When: Planned
+        Then: The file path is the target, so the new test runs too
+        """
+        # Arrange
+        project = coverage_project(tmp_path / "project")
+        impact_total(shipped_aggregator, project, tmp_path / "impact")
+        test_b = project / "tests" / "test_b.py"
+        test_b.write_text(test_b.read_text() + "\n\ndef test_new():\n    assert g() == 3\n")
+
+        # Act
+        plan = impact_plan(shipped_aggregator, project, tmp_path / "impact")
+
+        # Assert
+        assert not plan.full
+        assert plan.tests == ['tests/test_b.py']
+        assert plan.stale_tests == ['tests/test_b.py::test_g']
+
+    @pytest.mark.parametrize("changed,reason", [
+        ('pytest.ini', 'pytest.ini changed'),
+        ('tests/conftest.py', 'tests/conftest.py changed'),
+        ('src/pkg/new.py', 'src/pkg/new.py is not in the coverage map'),
+    ])
+    def test_unattributable_change_runs_full_suite(self, shipped_aggregator, tmp_path: Path, changed, reason):
+        """
+        Test changes no stored context can attribute fall back to the full suite.
+
+        Given: A config/conftest edit or a source file missing from the map
+        When: Planned
+        Then: A full run is planned, with the file as the reason
+        """
+        # Arrange
+        project = coverage_project(tmp_path / "project")
+        impact_total(shipped_aggregator, project, tmp_path / "impact")
+        with open(project / changed, 'a') as f:
+            f.write("\n")
+
+        # Act
+        plan = impact_plan(shipped_aggregator, project, tmp_path / "impact")
+
+        # Assert
+        assert plan.full
+        assert plan.reason == reason
+
+    def test_incremental_total_matches_full_run(self, shipped_aggregator, tmp_path: Path, capsys):
+        """
+        Test merging the impacted tests' measurement gives a full run's total.
+
+        Given: A stored map, then a.py gains a function no test calls
+        When: Coverage is measured incrementally
+        Then: Only impacted tests ran, and the total equals a full pytest-cov run's
+        """
+        # Arrange
+        project = coverage_project(tmp_path / "project")
+        impact_total(shipped_aggregator, project, tmp_path / "impact")
+        a_py = project / "src" / "pkg" / "a.py"
+        a_py.write_text(a_py.read_text() + "\n\ndef extra():\n    return 5\n")
+        capsys.readouterr()
+
+        # Act
+        total = impact_total(shipped_aggregator, project, tmp_path / "impact")
+
+        # Assert
+        assert "impacted tests only (2 node IDs or test files)" in capsys.readouterr().err
+        assert total == pytest.approx(full_run_coverage(project, tmp_path / "full.json"))
+
+    def test_branch_coverage_total_matches_full_run(self, shipped_aggregator, tmp_path: Path):
+        """
+        Test a branch-coverage project's total counts branches, as coverage.py does.
+
+        Given: A project whose .coveragerc enables branch coverage, with a partial branch in c.py
+        When: Coverage is measured through the map
+        Then: The total equals a full pytest-cov run's, not covered lines over statements,
+              and a later edit runs the full suite again
+        """
+        # Arrange
+        project = coverage_project(tmp_path / "project")
+        (project / ".coveragerc").write_text("[run]\nbranch = True\n")
+
+        # Act
+        total = impact_total(shipped_aggregator, project, tmp_path / "impact")
+        (project / "src" / "pkg" / "b.py").write_text("def g():\n    return 3  # edited\n")
+        plan = impact_plan(shipped_aggregator, project, tmp_path / "impact")
+
+        # Assert
+        assert total == pytest.approx(full_run_coverage(project, tmp_path / "full.json"))
+        assert plan.full
+        assert plan.reason == "branch coverage is not merged per test"
+
+
+# ==============================================================================
+# TC-038: Per-File Black Findings
+# ==============================================================================
+
+@pytest.mark.unit
+@pytest.mark.linter
+class TestBlackDiffFindings:
+    """
+    TC-038: Verify per-file black findings from black's unified diff.
+
+    The in-process check and the black command both produce a --diff style
+    diff; each file yields one finding at its first reformatted line.
+    """
+
+    def test_first_changed_line_after_context(self):
+        """
+        Test the finding points at the first changed line, not the hunk start.
+
+        Given: A hunk starting at line 1 with three context lines before the change
+        When: The diff is summarized
+        Then: line is 4, with 2 lines removed and 2 added
+        """
+        # Arrange
+        diff = [
+            "--- src/ugly.py\t2025-11-10 10:00:00+00:00",
+            "+++ src/ugly.py\t2025-11-10 10:00:01+00:00",
+            "@@ -1,5 +1,5 @@",
+            " import os",
+            " ",
+            " ",
+            "-def f(a,b):",
+            "-    return a+b",
+            "+def f(a, b):",
+            "+    return a + b",
+        ]
+
+        # Act
+        files = summarize_black_diff(diff)
+
+        # Assert
+        assert files == [{'file': 'src/ugly.py', 'line': 4, 'removed': 2, 'added': 2}]
+
+    def test_one_finding_per_file(self):
+        """
+        Test a diff covering several files yields one summary per file.
+
+        Given: Two files, the second with two hunks
+        When: The diff is summarized
+        Then: Two summaries; the second counts both hunks, line from the first
+        """
+        # Arrange
+        diff = [
+            "--- a.py", "+++ a.py", "@@ -1 +1 @@", "-x=1", "+x = 1",
+            "--- b.py", "+++ b.py",
+            "@@ -3,2 +3,3 @@", " def g():", "+", "     return 1",
+            "@@ -40 +41 @@", "-y=2", "+y = 2",
+        ]
+
+        # Act
+        files = summarize_black_diff(diff)
+
+        # Assert
+        assert [(f['file'], f['line'], f['removed'], f['added']) for f in files] == [('a.py', 1, 1, 1), ('b.py', 4, 1, 2)]
+
+    def test_removed_line_looking_like_header(self):
+        """
+        Test a removed line starting with '-- ' stays inside its hunk.
+
+        Given: A removed source line "-- x" (rendered "--- x" in the diff)
+        When: The diff is summarized
+        Then: No new file starts; the line counts as removed
+        """
+        # Arrange
+        diff = ["--- doc.py", "+++ doc.py", "@@ -1,2 +1,2 @@", "--- x", "-y=1", "+-- x", "+y = 1"]
+
+        # Act
+        files = summarize_black_diff(diff)
+
+        # Assert
+        assert files == [{'file': 'doc.py', 'line': 1, 'removed': 2, 'added': 2}]
+
+
+# ==============================================================================
+# TC-039: Shared AST Cache and Convention Checks
+# ==============================================================================
+
+@pytest.mark.unit
+@pytest.mark.linter
+class TestSharedAstConventions:
+    """
+    TC-039: Verify SourceCache parse sharing and the hanax convention checks.
+
+    radon and hanax read one tree per distinct file content; hanax flags
+    missing annotations and Args: sections out of sync with the signature.
+    """
+
+    def test_args_section_names(self):
+        """
+        Test parameter names are read from a Google-style Args: section.
+
+        Given: Entries with types, *args/**kwargs and a wrapped description
+        When: The documented parameters are extracted
+        Then: Only entry names, stopping at the Returns: section
+        """
+        # Arrange
+        docstring = """Run it.
+
+        Args:
+            path (str): Where to look
+            *args: Passed on
+                continued: not an entry
+            **kwargs: Options
+
+        Returns:
+            result: not a parameter
+        """
+
+        # Act
+        names = documented_params(docstring)
+
+        # Assert
+        assert names == ['path', 'args', 'kwargs']
+        assert documented_params("No sections here.") is None
+
+    def test_type_hints_skip_self_and_init_return(self):
+        """
+        Test self/cls and __init__'s return are not required to be annotated.
+
+        Given: A class with an annotated __init__, a bare staticmethod and a private method
+        When: Missing annotations are collected
+        Then: Only the staticmethod's parameter and return are reported
+        """
+        # Arrange
+        source = (
+            "class Thing:\n"
+            "    def __init__(self, x: int):\n"
+            "        self.x = x\n"
+            "    @staticmethod\n"
+            "    def make(y):\n"
+            "        return Thing(y)\n"
+            "    def _hidden(self, z):\n"
+            "        return z\n"
+        )
+
+        # Act
+        missing = missing_type_hints(ast.parse(source))
+
+        # Assert
+        assert missing == {'Thing.make': ['y', 'return']}
+
+    def test_identical_content_parsed_once(self):
+        """
+        Test identical files share one tree and trees are released after the last checker.
+
+        Given: Two checkers looking up three files, two with the same content
+        When: Every file is looked up once per checker
+        Then: Two parses, four reuses, and no tree left held
+        """
+        # Arrange
+        files = {'a.py': b"x = 1\n", 'b.py': b"x = 1\n", 'c.py': b"y = 2\n"}
+
+        # Act
+        parsed, reused, held = count_shared_parses(files, consumers=2)
+
+        # Assert
+        assert (parsed, reused, held) == (2, 4, 0)
+
+
+# ==============================================================================
+# TC-040: Shipped LinterAggregator - Cross-File Invalidation
+# ==============================================================================
+
+@pytest.mark.integration
+@pytest.mark.linter
+@pytest.mark.skipif(shutil.which("pylint") is None, reason="pylint not installed")
+class TestShippedCrossFileInvalidation:
+    """
+    TC-040: Verify the shipped LinterAggregator keeps pylint's cross-file findings.
+
+    pylint's import checks read the imported module, so editing one file
+    changes findings in another whose content did not change; duplicate-code
+    and cyclic-import compare files, so shards must not split them.
+    """
+
+    def test_renamed_import_reported_on_warm_run(self, shipped_aggregator, tmp_path: Path):
+        """
+        Test renaming a function is reported in the unchanged file importing it.
+
+        Given: A cold cached run of pylint and hanax over src/mod.py and tests/test_mod.py
+        When: g is renamed to h in src/mod.py only, and the tree is linted warm
+        Then: pylint reports "No name 'g'" in tests/test_mod.py, as an uncached run does,
+              while hanax replays the unchanged file from the cache
+        """
+        # Arrange
+        project = tmp_path / "project"
+        (project / "src").mkdir(parents=True)
+        (project / "tests").mkdir()
+        (project / "src" / "__init__.py").write_text("")
+        (project / "tests" / "__init__.py").write_text("")
+        (project / "src" / "mod.py").write_text('"""Module."""\n\n\ndef g() -> int:\n    """G."""\n    return 1\n')
+        (project / "tests" / "test_mod.py").write_text(
+            '"""Tests."""\nfrom src.mod import g\n\n\ndef test_g():\n    """Test."""\n    assert g() == 1\n')
+        cache = shipped_aggregator.LintResultCache(tmp_path / "cache")
+        cold = run_shipped_linters(shipped_aggregator, project, cache)
+
+        # Act
+        mod = project / "src" / "mod.py"
+        mod.write_text(mod.read_text().replace("def g(", "def h("))
+        warm_aggregator, warm = run_shipped_linters(shipped_aggregator, project, cache, keep_aggregator=True)
+        uncached = run_shipped_linters(shipped_aggregator, project, None)
+
+        # Assert
+        assert not [issue for issue in cold if issue[0] == 'pylint' and issue[2] == 'P0']
+        assert ('pylint', 'tests/test_mod.py', 'P0', "No name 'g' in module 'src.mod'") in warm
+        assert warm == uncached
+        assert 'pylint' not in warm_aggregator.cache_stats
+        assert warm_aggregator.cache_stats['hanax'] == {'hits': 3, 'misses': 1}
+
+    def test_sharded_pylint_matches_single_process(self, shipped_aggregator, tmp_path: Path):
+        """
+        Test sharded pylint reports the cross-file findings of a single process.
+
+        Given: A package with an import cycle and a function duplicated in two modules
+        When: pylint runs as one process and as two forced shards
+        Then: The same findings in the same order, cyclic-import and duplicate-code last
+        """
+        # Arrange
+        package = tmp_path / "pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text('"""Package."""\n')
+        (package / "a.py").write_text('"""A."""\nfrom pkg import b\n\n\ndef fa():\n    """Fa."""\n    return b.fb()\n')
+        (package / "b.py").write_text('"""B."""\n\n\ndef fb():\n    """Fb."""\n    from pkg import a\n    return a\n')
+        body = "".join(f"    total += {step}\n    print(total)\n" for step in range(4))
+        for name in ("c", "d"):
+            (package / f"{name}.py").write_text(f'"""{name}."""\n\n\ndef f{name}():\n    """F."""\n'
+                                                f"    total = 0\n{body}    return total\n")
+
+        # Act
+        findings = {}
+        for shards in (1, 2):
+            aggregator = shipped_aggregator.LinterAggregator(str(tmp_path), jobs=2, shards=shards)
+            issues = aggregator._run_pylint(120)
+            findings[shards] = [(Path(issue.file).name, issue.line, issue.details) for issue in issues]
+            timing = aggregator.timings['pylint']
+
+        # Assert
+        assert timing.shards == 2
+        assert findings[2] == findings[1]
+        assert [details.split(' ')[0] for _, _, details in findings[1][-2:]] == ['duplicate-code', 'cyclic-import']
+
+
+# ==============================================================================
+# TC-041: Shared --jobs Budget
+# ==============================================================================
+
+@pytest.mark.unit
+@pytest.mark.linter
+class TestSharedJobsBudget:
+    """
+    TC-041: Verify shards and worker pools stay within the --jobs budget.
+
+    Each running linter holds one CpuBudget slot; processes beyond a
+    linter's first only start on slots other linters have freed.
+    """
+
+    def test_reserve_takes_only_free_slots(self, shipped_aggregator):
+        """
+        Test reserve() never waits and never takes more than is free.
+
+        Given: A budget of 3 slots with one held by a running linter
+        When: A pool asks for 4 extra workers, then for 1 more
+        Then: It gets 2, then 0; after release it can take 2 again
+        """
+        # Arrange
+        budget = shipped_aggregator.CpuBudget(3)
+
+        # Act
+        with budget:
+            first = budget.reserve(4)
+            second = budget.reserve(1)
+            budget.release(first)
+            third = budget.reserve(2)
+
+        # Assert
+        assert (first, second, third) == (2, 0, 2)
+
+    def test_shards_wait_for_slots_of_other_linters(self, shipped_aggregator, tmp_path: Path):
+        """
+        Test forced shards run within the budget, using slots as other linters free them.
+
+        Given: --jobs 2, --shards 4, and another linter holding the second slot for 0.3 s
+        When: bandit's files are linted through _run_sharded
+        Then: All 4 shards run, one at a time until the slot is freed, never more than 2 at once
+        """
+        # Arrange
+        files = []
+        for index in range(8):
+            files.append(tmp_path / f"m{index}.py")
+            files[-1].write_text("x = 1\n" * (index + 1))
+        aggregator = shipped_aggregator.LinterAggregator(str(tmp_path), jobs=2, shards=4)
+        module = shipped_aggregator
+        running, log, lock = [0], [], threading.Lock()
+        other_linter = aggregator.budget.reserve(1)
+        threading.Timer(0.3, aggregator.budget.release, args=(other_linter,)).start()
+
+        def run_shard(name, targets, timeout):
+            with lock:
+                running[0] += 1
+                log.append((time.perf_counter(), running[0]))
+            time.sleep(0.2)
+            with lock:
+                running[0] -= 1
+            aggregator.timings[name] = module.LinterTiming(0.2, 0.1)
+            return [module.Issue("", module.Priority.P2, module.Category.SECURITY, "bandit", target, 1, "m", "d")
+                    for target in targets]
+
+        # Act
+        start = time.perf_counter()
+        with aggregator.budget:  # Held by this linter, as _run_linter does
+            issues = aggregator._run_sharded('bandit', run_shard, 60, [str(path) for path in files])
+
+        # Assert
+        assert [Path(issue.file).name for issue in issues] == [f"m{index}.py" for index in range(8)]
+        assert aggregator.timings['bandit'].shards == 4
+        assert max(count for _, count in log) == 2
+        assert all(count == 1 for at, count in log if at - start < 0.25)
+
+
+# ==============================================================================
+# TC-043: Shipped run_all() - Issues Emitted While Later Linters Run
+# ==============================================================================
+
+@pytest.mark.unit
+@pytest.mark.linter
+class TestShippedRunAllStreaming:
+    """
+    TC-043: Verify run_all(emit=...) writes a linter's issues before later linters finish.
+
+    IDs follow report order, so a linter's issues can go out once it and
+    every linter before it are done; they must not wait for the pool.
+    """
+
+    def test_first_issue_emitted_while_later_linter_blocks(self, shipped_aggregator, tmp_path: Path):
+        """
+        Test bandit's issue reaches emit while pytest (last in report order) is still running.
+
+        Given: bandit finishing at once with one issue, pytest blocked until something is emitted
+        When: run_all(emit=...) runs both
+        Then: pytest is released by the first emitted issue, and IDs follow report order
+        """
+        # Arrange
+        module = shipped_aggregator
+        aggregator = module.LinterAggregator(str(tmp_path), jobs=2)
+        aggregator.LINTERS = [('bandit', 'security', 'BAN', 60), ('pytest', 'coverage', 'COV', 300)]
+        emitted, first_emitted = [], threading.Event()
+        released_by_emit = []
+
+        def issue(source: str) -> Any:
+            return module.Issue("", module.Priority.P2, module.Category.QUALITY, source, "a.py", 1, "m", "d")
+
+        def run_pytest(timeout):
+            released_by_emit.append(first_emitted.wait(timeout=10))
+            return [issue('pytest')]
+
+        aggregator._run_bandit = lambda timeout: [issue('bandit')]
+        aggregator._run_pytest = run_pytest
+
+        def emit(emitted_issue):
+            emitted.append(emitted_issue.id)
+            first_emitted.set()
+
+        # Act
+        result = aggregator.run_all(emit=emit)
+
+        # Assert
+        assert released_by_emit == [True]
+        assert emitted == ['BAN-001', 'COV-002']
+        assert [issue.id for issue in result.issues] == emitted
+
+
+# ==============================================================================
+# Helper Functions
+# ==============================================================================
+
+def parse_version(version_string: str) -> tuple:
+    """
+    DEPRECATED: Use packaging.version.parse() instead.
+    
+    Legacy simple parser that only handles numeric versions.
+    Kept for backward compatibility but not used.
+
+    Args:
+        version_string: Version string like "1.7.5"
+
+    Returns:
+        tuple: Version tuple like (1, 7, 5)
+    """
+    return tuple(map(int, version_string.split('.')))
+
+
+def compare_versions(version1: str, version2: str) -> int:
+    """
+    Compare two version strings using PEP 440 compliant parsing.
+    
+    Handles complex versions including:
+    - Pre-releases: 1.0.0a1, 1.0.0b2, 1.0.0rc1
+    - Post-releases: 1.0.0.post1
+    - Dev releases: 1.0.0.dev1
+    - Local versions: 1.0.0+local.version
+    
+    Args:
+        version1: First version string (e.g., "1.7.5", "0.900a1")
+        version2: Second version string (e.g., "1.7.6", "0.900")
+
+    Returns:
+        int: -1 if v1 < v2, 0 if equal, 1 if v1 > v2
+        
+    Examples:
+        >>> compare_versions("1.0.0", "1.0.1")
+        -1
+        >>> compare_versions("1.0.0", "1.0.0")
+        0
+        >>> compare_versions("1.0.0", "1.0.0a1")
+        1
+        >>> compare_versions("0.900", "0.910")
+        -1
+    """
+    v1 = version.parse(version1)
+    v2 = version.parse(version2)
+
+    if v1 < v2:
+        return -1
+    elif v1 > v2:
+        return 1
+    return 0
+
+
+# Report order used by LinterAggregator.LINTERS
+LINTER_ORDER = ['bandit', 'pylint', 'mypy', 'radon', 'black', 'pytest']
+
+
+def run_linters_concurrently(linters: List[Tuple[str, Callable]], jobs: int) -> Tuple[Dict, Dict]:
+    """
+    Run linter callables under a CPU budget, as LinterAggregator.run_all does.
+
+    Args:
+        linters: (name, callable returning that linter's issue list) pairs
+        jobs: Maximum number of linters running at once
+
+    Returns:
+        tuple: (issue lists by linter name, exceptions by linter name)
+    """
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {name: executor.submit(linter) for name, linter in linters}
+
+    results, failures = {}, {}
+    for name, future in futures.items():
+        if future.exception():
+            failures[name] = future.exception()
+        else:
+            results[name] = future.result()
+    return results, failures
+
+
+def lint_cache_key(linter: str, version: str, config_hash: str, rel_path: str, content: bytes) -> str:
+    """
+    Build a LintResultCache key, as LinterAggregator does.
+
+    Args:
+        linter: Linter name (e.g. "pylint")
+        version: Output of `<linter> --version`
+        config_hash: SHA-256 of the linter's config files
+        rel_path: File path relative to the linted tree
+        content: Raw file content
+
+    Returns:
+        str: 64-character hex cache key
+    """
+    content_hash = hashlib.sha256(content).hexdigest()
+    material = '\0'.join(["1.0", linter, version, config_hash, rel_path, content_hash])
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+# MypyBackend.MESSAGE: file:line:column: severity: message  [code]
+MYPY_MESSAGE = re.compile(
+    r'^(?P<file>.+?):(?:(?P<line>-?\d+):(?:(?P<column>-?\d+):)?)? '
+    r'(?P<severity>error|warning|note): (?P<message>.*?)(?:  \[(?P<code>[a-z0-9-]+)\])?$'
+)
+
+
+def decode_mypy_errors(lines: List[str]) -> List[Dict[str, Any]]:
+    """
+    Decode mypy output lines into error records, as MypyBackend.iter_errors does.
+
+    Args:
+        lines: mypy stdout lines (JSON objects or text)
+
+    Returns:
+        list: Error dicts (file, line, column, message, code, hint)
+    """
+    def position(value: Any) -> Optional[int]:
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            return None
+        return number if number > 0 else None
+
+    errors, pending = [], None
+    for line in lines:
+        if line.startswith('{'):
+            message = json.loads(line)
+            if isinstance(message.get('column'), int) and message['column'] >= 0:
+                message['column'] += 1
+            note_of_pending = False
+        else:
+            match = MYPY_MESSAGE.match(line)
+            if match is None:
+                continue
+            message = match.groupdict()
+            note_of_pending = pending is not None and message['file'] == pending['file']
+        if message.get('severity') == 'note':
+            if note_of_pending:
+                pending['hint'] = '\n'.join(filter(None, [pending.get('hint'), message['message']]))
+            continue
+        if pending is not None:
+            errors.append(pending)
+        pending = None
+        if message.get('severity') == 'error':
+            pending = {
+                'file': message['file'],
+                'line': position(message.get('line')),
+                'column': position(message.get('column')),
+                'message': message['message'],
+                'code': message.get('code'),
+                'hint': message.get('hint'),
+            }
+    if pending is not None:
+        errors.append(pending)
+    return errors
+
+
+def partition_files(sizes: Dict[str, int], count: int) -> List[List[str]]:
+    """
+    Split files into balanced shards, as LinterAggregator._partition does.
+
+    Args:
+        sizes: File path → cost (size in bytes), in tree order
+        count: Number of shards
+
+    Returns:
+        list: Non-empty shards, each listing its files in tree order
+    """
+    loads = [(0, index) for index in range(count)]
+    assigned = {}
+    for path in sorted(sizes, key=sizes.__getitem__, reverse=True):
+        load, index = heapq.heappop(loads)
+        assigned[path] = index
+        heapq.heappush(loads, (load + sizes[path], index))
+    shards = [[path for path in sizes if assigned[path] == index] for index in range(count)]
+    return [shard for shard in shards if shard]
+
+
+def merge_shard_issues(files: List[str], shard_results: List[List[Tuple[str, int]]]) -> List[Tuple[str, int]]:
+    """
+    Merge per-shard (file, line) issues in file order (LinterAggregator._run_sharded rule).
+
+    Args:
+        files: Sharded files in tree order
+        shard_results: Each shard's issues in linter order
+
+    Returns:
+        list: Issues ordered by file position, stable within a file
+    """
+    position = {path: index for index, path in enumerate(files)}
+    issues = [issue for shard_issues in shard_results for issue in shard_issues]
+    return sorted(issues, key=lambda issue: position.get(issue[0], len(position)))
+
+
+def shard_count(cores: int, memory_mb: int, process_mb: int, files: int, min_files_per_shard: int = 100) -> int:
+    """
+    Processes for a sharded linter, as LinterAggregator._shard_limit/_shard_count decide.
+
+    Args:
+        cores: Usable CPU cores
+        memory_mb: Memory budget for shard processes
+        process_mb: Budgeted peak RSS of one linter process
+        files: Number of files to lint
+        min_files_per_shard: Files below which a process is not worth starting
+
+    Returns:
+        int: Shard count (1 = single process)
+    """
+    limit = max(1, min(cores, memory_mb // process_mb))
+    return max(1, min(limit, files // min_files_per_shard, files))
+
+
+def schedule_makespan(durations: List[float], workers: int) -> float:
+    """
+    Finish time of jobs submitted in order to a worker pool (each taken by the first free worker).
+
+    Args:
+        durations: Job durations in submission order
+        workers: Pool size
+
+    Returns:
+        float: Time the last job finishes
+    """
+    loads = [0.0] * workers
+    for duration in durations:
+        heapq.heapreplace(loads, loads[0] + duration)
+    return max(loads)
+
+
+def attribute_process(cpu_seconds: float, startup: float, usual: Dict[str, float], changed: List[str],
+                      noise: float = 0.2, factor: float = 3.0, min_seconds: float = 2.0) -> Tuple[Dict[str, float], List[str]]:
+    """
+    Split one process's CPU time over its files and flag slow ones (LintCostModel._record_process rules).
+
+    Args:
+        cpu_seconds: Process CPU time
+        startup: Process start-up seconds
+        usual: File → usual CPU seconds
+        changed: Files edited since their last run
+        noise: Fraction above the prediction that is run-to-run noise
+        factor: Times slower than usual for a file to be flagged
+        min_seconds: Seconds slower than usual for a file to be flagged
+
+    Returns:
+        tuple: (file → attributed seconds, flagged files)
+    """
+    predicted = startup + sum(usual.values())
+    work = max(cpu_seconds - startup, 0.0)
+    slow = cpu_seconds - predicted >= max(min_seconds, noise * predicted)
+    targets = changed if slow and changed else list(usual)
+    shares = {path: usual[path] for path in usual if path not in targets}
+    remaining = max(work - sum(shares.values()), 0.0)
+    total = sum(usual[path] for path in targets)
+    for path in targets:
+        shares[path] = remaining * usual[path] / total
+    flagged = [path for path in changed if slow and shares[path] >= factor * usual[path]
+               and shares[path] - usual[path] >= min_seconds]
+    return shares, flagged
+
+
+def fit_process_cost(samples: List[Tuple[int, float]], prior_startup: float, alpha: float = 0.3) -> Tuple[float, float]:
+    """
+    Start-up seconds and seconds per byte from decayed least-squares sums (LintCostModel._fit).
+
+    Args:
+        samples: (bytes linted, CPU seconds) per process, oldest first
+        prior_startup: Start-up used when sizes never varied
+        alpha: Weight of the newest sample
+
+    Returns:
+        tuple: (start-up seconds, seconds per byte)
+    """
+    weight = size = seconds = size_squared = size_seconds = 0.0
+    for sample_size, sample_seconds in samples:
+        weight = weight * (1 - alpha) + alpha
+        size = size * (1 - alpha) + alpha * sample_size
+        seconds = seconds * (1 - alpha) + alpha * sample_seconds
+        size_squared = size_squared * (1 - alpha) + alpha * sample_size ** 2
+        size_seconds = size_seconds * (1 - alpha) + alpha * sample_size * sample_seconds
+    mean_size, mean_seconds = size / weight, seconds / weight
+    variance = size_squared / weight - mean_size ** 2
+    if variance > (0.1 * mean_size) ** 2:
+        per_byte = (size_seconds / weight - mean_size * mean_seconds) / variance
+        return mean_seconds - per_byte * mean_size, per_byte
+    startup = min(prior_startup, mean_seconds)
+    return startup, (mean_seconds - startup) / mean_size
+
+
+def index_issues(issues: List[Dict[str, Any]]) -> Dict[str, Dict[Any, List[Dict[str, Any]]]]:
+    """
+    Per-field indexes built on insert, as IssueStore.add maintains them.
+
+    Args:
+        issues: Issue dicts in report order
+
+    Returns:
+        dict: Field → value → issues (files keyed by absolute path)
+    """
+    indexes = {field: {} for field in ('file', 'source', 'category', 'priority')}
+    for issue in issues:
+        indexes['file'].setdefault(os.path.abspath(issue['file']), []).append(issue)
+        for field in ('source', 'category', 'priority'):
+            indexes[field].setdefault(issue[field], []).append(issue)
+    return indexes
+
+
+def top_n_by_priority(indexes: Dict[str, Dict[Any, List[Dict[str, Any]]]], n: int) -> List[Dict[str, Any]]:
+    """
+    The n most severe issues from the priority index (IssueStore.top_n_by_priority).
+
+    Args:
+        indexes: Output of index_issues
+        n: Number of issues
+
+    Returns:
+        list: P0 issues first, report order within a priority
+    """
+    top = []
+    for priority in ('P0', 'P1', 'P2', 'P3'):
+        top.extend(indexes['priority'].get(priority, [])[:n - len(top)])
+    return top
+
+
+def deduplicate_with_indexes(layer1: List[Dict[str, Any]], layer3: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Layer 3 findings left after Layer 1 precedence (LAYER3-INTEGRATION-SPEC.md §3.3, index lookups).
+
+    Args:
+        layer1: Linter findings (file, line, category, severity)
+        layer3: CodeRabbit findings
+
+    Returns:
+        list: Layer 3 findings that are not duplicates, complementary ones marked
+    """
+    fingerprints = {(f['file'], f['line'], f['category'], f['severity']) for f in layer1}
+    categories = {}
+    for finding in layer1:
+        categories.setdefault((finding['file'], finding['line']), set()).add(finding['category'])
+    kept = []
+    for finding in layer3:
+        if (finding['file'], finding['line'], finding['category'], finding['severity']) in fingerprints:
+            continue
+        if categories.get((finding['file'], finding['line']), set()) - {finding['category']}:
+            finding['complementary_to_layer1'] = True
+        kept.append(finding)
+    return kept
+
+
+def coverage_project(project: Path) -> Path:
+    """
+    Write a small src/ + tests/ project for CoverageImpact.
+
+    a.py is covered by test_f and test_both, b.py by test_g and test_both,
+    c.py by three tests that never take its false branch.
+
+    Args:
+        project: Directory to create
+
+    Returns:
+        Path: project
+    """
+    files = {
+        "pytest.ini": "[pytest]\npythonpath = src\n",
+        "src/pkg/__init__.py": "",
+        "src/pkg/a.py": "def f(x):\n    if x:\n        return 1\n    return 2\n",
+        "src/pkg/b.py": "def g():\n    return 3\n",
+        "src/pkg/c.py": "def h(x):\n    if x:\n        return x\n    return 0\n\n\ndef unused():\n    return 4\n",
+        "tests/test_a.py": "from pkg.a import f\n\n\ndef test_f():\n    assert f(1) == 1\n",
+        "tests/test_b.py": "from pkg.b import g\n\n\ndef test_g():\n    assert g() == 3\n",
+        "tests/test_mix.py": "from pkg.a import f\nfrom pkg.b import g\n\n\ndef test_both():\n    assert f(0) == 2 and g() == 3\n",
+        "tests/test_c.py": "from pkg.c import h\n" + "".join(
+            f"\n\ndef test_{n}():\n    assert h({n}) == {n}\n" for n in (1, 2, 3)),
+    }
+    for rel_path, content in files.items():
+        (project / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (project / rel_path).write_text(content)
+    return project
+
+
+def impact_plan(module, project: Path, cache_base: Path):
+    """
+    Plan the shipped CoverageImpact would run for the tree as it is now.
+
+    Args:
+        module: Shipped linter_aggregator module
+        project: Project tree
+        cache_base: CoverageImpact state directory
+
+    Returns:
+        ImpactPlan: Tests to run and stored data to replace
+    """
+    aggregator = module.LinterAggregator(str(project), jobs=1)
+    impact = module.CoverageImpact(cache_base)
+    return impact.plan(project, impact.fingerprint(project, aggregator._hash_python_files()))
+
+
+def impact_total(module, project: Path, cache_base: Path) -> float:
+    """
+    Total coverage through the shipped LinterAggregator with a CoverageImpact map.
+
+    Args:
+        module: Shipped linter_aggregator module
+        project: Project tree
+        cache_base: CoverageImpact state directory (kept across calls)
+
+    Returns:
+        float: Total coverage percentage
+    """
+    aggregator = module.LinterAggregator(str(project), jobs=1, impact=module.CoverageImpact(cache_base))
+    return aggregator._impact_coverage(timeout=120)
+
+
+def full_run_coverage(project: Path, report: Path) -> float:
+    """
+    Total coverage of a plain full pytest-cov run (the project's own coverage config).
+
+    Args:
+        project: Project tree
+        report: Where coverage json is written
+
+    Returns:
+        float: totals.percent_covered
+    """
+    env = {**os.environ, 'COVERAGE_FILE': str(report.with_suffix('.db'))}
+    subprocess.run(['pytest', '--cov=src', f'--cov-report=json:{report}', '--quiet'],
+                   cwd=project, env=env, capture_output=True, timeout=120)
+    with open(report) as f:
+        return json.load(f)['totals']['percent_covered']
+
+
+def summarize_black_diff(lines: List[str]) -> List[Dict[str, Any]]:
+    """
+    First changed line and removed/added counts per file of a unified diff (black_diff_files).
+
+    Args:
+        lines: black --diff output, one line per element
+
+    Returns:
+        list: {'file', 'line', 'removed', 'added'} per file, in diff order
+    """
+    files, old_left, new_left, line = [], 0, 0, 0
+    for text in lines:
+        if old_left or new_left:
+            if text.startswith(' '):
+                old_left, new_left, line = old_left - 1, new_left - 1, line + 1
+            elif text[:1] in ('-', '+'):
+                if files[-1]['line'] is None:
+                    files[-1]['line'] = max(line, 1)
+                if text.startswith('-'):
+                    files[-1]['removed'] += 1
+                    old_left, line = old_left - 1, line + 1
+                else:
+                    files[-1]['added'] += 1
+                    new_left -= 1
+        elif text.startswith('--- '):
+            files.append({'file': text[4:].split('\t', 1)[0], 'line': None, 'removed': 0, 'added': 0})
+        elif files and text.startswith('@@'):
+            match = re.match(r'^@@ -(\d+)(?:,(\d+))? \+\d+(?:,(\d+))? @@', text)
+            line, old_left, new_left = int(match.group(1)), int(match.group(2) or 1), int(match.group(3) or 1)
+    return files
+
+
+def documented_params(docstring: Optional[str]) -> Optional[List[str]]:
+    """
+    Parameter names listed in a Google-style Args: section (ConventionChecker.documented_params).
+
+    Args:
+        docstring: Function docstring (None if there is none)
+
+    Returns:
+        list: Entry names in order, or None without an Args: section
+    """
+    if not docstring:
+        return None
+    lines = docstring.splitlines()
+    for index, line in enumerate(lines):
+        if line.strip() not in ('Args:', 'Arguments:', 'Parameters:'):
+            continue
+        section_indent = len(line) - len(line.lstrip())
+        entry_indent = None
+        names = []
+        for entry in lines[index + 1:]:
+            if not entry.strip():
+                continue
+            indent = len(entry) - len(entry.lstrip())
+            if indent <= section_indent:
+                break
+            if entry_indent is None:
+                entry_indent = indent
+            match = re.match(r'^\*{0,2}(\w+)\s*(?:\(.*\))?\s*:', entry.strip()) if indent == entry_indent else None
+            if match:
+                names.append(match.group(1))
+        return names
+    return None
+
+
+def missing_type_hints(tree: ast.Module) -> Dict[str, List[str]]:
+    """
+    Unannotated parameters (and 'return') of public functions and public class methods.
+
+    Args:
+        tree: Parsed module
+
+    Returns:
+        dict: Qualified function name → missing names, for functions missing any
+    """
+    functions = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.append((node, node.name, False))
+        elif isinstance(node, ast.ClassDef) and not node.name.startswith('_'):
+            functions.extend((member, f"{node.name}.{member.name}", True) for member in node.body
+                             if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)))
+    missing = {}
+    for node, name, method in functions:
+        if node.name.startswith('_') and node.name != '__init__':
+            continue
+        positional = node.args.posonlyargs + node.args.args
+        static = any(isinstance(d, ast.Name) and d.id == 'staticmethod' for d in node.decorator_list)
+        if method and not static:
+            positional = positional[1:]
+        params = positional + node.args.kwonlyargs + [a for a in (node.args.vararg, node.args.kwarg) if a is not None]
+        names = [arg.arg for arg in params if arg.annotation is None]
+        if node.returns is None and node.name != '__init__':
+            names.append('return')
+        if names:
+            missing[name] = names
+    return missing
+
+
+def count_shared_parses(files: Dict[str, bytes], consumers: int) -> Tuple[int, int, int]:
+    """
+    Parses, reuses and trees still held after each checker looks up every file once (SourceCache).
+
+    Args:
+        files: Path → content, looked up in order by each checker
+        consumers: Number of checkers
+
+    Returns:
+        tuple: (parsed, reused, held)
+    """
+    hashes, entries = {}, {}
+    parsed = reused = 0
+    for _ in range(consumers):
+        for path, content in files.items():
+            content_hash = hashes.get(path)
+            entry = entries.get(content_hash) if content_hash is not None else None
+            if entry is None:
+                content_hash = hashes[path] = hashlib.sha256(content).hexdigest()
+                entry = entries.get(content_hash)
+                if entry is None:
+                    parsed += 1
+                    entry = entries[content_hash] = [ast.parse(content), consumers]
+                else:
+                    reused += 1
+                    entry[1] += consumers
+            else:
+                reused += 1
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del entries[content_hash]
+    return parsed, reused, len(entries)
+
+
+def run_shipped_linters(module, project: Path, cache, keep_aggregator: bool = False):
+    """
+    Run pylint and hanax through the shipped LinterAggregator.run_all().
+
+    Args:
+        module: Shipped linter_aggregator module
+        project: Tree to lint
+        cache: LintResultCache, or None for an uncached run
+        keep_aggregator: Also return the aggregator (for cache_stats)
+
+    Returns:
+        list: (source, relative file, priority, message) per issue, in report order
+    """
+    aggregator = module.LinterAggregator(str(project), jobs=2, cache=cache)
+    aggregator.LINTERS = [('pylint', 'quality', 'PYL', 120), ('hanax', 'conventions', 'HNX', 30)]
+    result = aggregator.run_all()
+    issues = [(issue.source, Path(issue.file).resolve().relative_to(project.resolve()).as_posix(),
+               issue.priority.value, issue.message) for issue in result.issues]
+    return (aggregator, issues) if keep_aggregator else issues
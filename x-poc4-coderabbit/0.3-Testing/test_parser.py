@@ -1,10 +1,16 @@
 """
-Parser Unit Tests (TC-001 to TC-003)
+Parser Unit Tests (TC-001 to TC-003, TC-026, TC-027, TC-029 to TC-031, TC-042)
 
 Tests the CodeRabbit output parser's core functionality:
 - TC-001: Security pattern matching
 - TC-002: SOLID principle detection
 - TC-003: Code quality detection
+- TC-026: Compact issue representation (slots, interning, columnar batch)
+- TC-027: Streaming JSON output (issues first, counters last)
+- TC-029: Parse result cache (keyed hash, size-bounded LRU)
+- TC-030: Structured input (SARIF field map, chunked decoding)
+- TC-031: Pattern profiling (call/match counts, side report)
+- TC-042: Shipped parser: parse_parallel()/parse_stream() equal parse()
 
 Author: Julia Santos - Testing & QA Specialist
 Date: 2025-11-10
@@ -12,8 +18,18 @@ Version: 1.0
 """
 
 import pytest
+import io
+import re
+import sys
 import json
-from typing import Dict, List
+import time
+import subprocess
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
 
 # ==============================================================================
 # Custom pytest markers for parser implementation status
@@ -338,6 +354,490 @@ class TestCodeQualityDetection:
         pass
 
 
+# ==============================================================================
+# TC-026: Compact Issue Representation
+# ==============================================================================
+
+@pytest.mark.unit
+class TestCompactIssueRepresentation:
+    """
+    TC-026: Verify the slotted Issue and columnar IssueBatch layouts.
+
+    Slotted issues drop the per-instance __dict__, file paths are interned so
+    issues from one file share a string, and the columnar batch stores each
+    path once with 1-byte priority codes.
+    """
+
+    def test_slotted_issue_has_no_instance_dict(self):
+        """
+        Test slotted issues reject stray attributes and carry no __dict__.
+
+        Given: An Issue declared with @dataclass(slots=True)
+        When: An instance is created
+        Then: It has no __dict__, and assigning an undeclared field fails
+        """
+        # Arrange
+        @dataclass(slots=True)
+        class Issue:
+            id: str
+            priority: str
+            file: str
+            line: Optional[int]
+
+        # Act
+        issue = Issue("DEF-001", "P0", "src/config.py", 42)
+
+        # Assert
+        assert not hasattr(issue, "__dict__")
+        with pytest.raises(AttributeError):
+            issue.severity = "high"
+
+    def test_interned_paths_are_shared(self):
+        """
+        Test issues from the same file share one path string.
+
+        Given: Two file paths parsed separately from CodeRabbit output
+        When: Both are interned
+        Then: They are the same object, not equal copies
+        """
+        # Arrange
+        first = "".join(["src/", "config.py"])
+        second = "".join(["src/", "config.py"])
+        assert first is not second
+
+        # Act & Assert
+        assert sys.intern(first) is sys.intern(second)
+
+    def test_columnar_batch_matches_issue_list(self):
+        """
+        Test columnar storage round-trips and counts like the issue list.
+
+        Given: Issues across two files with mixed priorities
+        When: They are stored as parallel columns
+        Then: Each path is stored once and priority counts match the list
+        """
+        # Arrange
+        issues = [
+            {"priority": "P0", "file": "src/config.py", "line": 42},
+            {"priority": "P2", "file": "src/config.py", "line": 50},
+            {"priority": "P0", "file": "src/app.py", "line": 7},
+        ]
+
+        # Act
+        priorities, file_indexes, lines, files = build_issue_columns(issues)
+
+        # Assert
+        assert files == ["src/config.py", "src/app.py"]
+        assert priorities.itemsize == 1
+        assert [files[index] for index in file_indexes] == [issue["file"] for issue in issues]
+        assert list(lines) == [42, 50, 7]
+        assert priorities.count(0) == count_issues_by_priority(issues, "P0")
+
+
+# ==============================================================================
+# TC-027: Streaming JSON Output
+# ==============================================================================
+
+@pytest.mark.unit
+class TestStreamingJsonOutput:
+    """
+    TC-027: Verify issues can be written one at a time with counters last.
+
+    The shipped JsonStreamWriter's document must decode to the same result
+    as the one-shot json.dumps() output; only the key order differs.
+    """
+
+    @pytest.mark.parametrize("issue_count", [0, 1, 3])
+    def test_streamed_document_matches_one_shot_dump(self, shipped_parser, issue_count: int):
+        """
+        Test piecewise output is the same indented document.
+
+        Given: A header, N issues and a trailer of counters (with emoji)
+        When: JsonStreamWriter writes each piece separately
+        Then: The bytes equal json.dumps(indent=2) of the assembled document, as UTF-8
+        """
+        # Arrange
+        issues = [{"id": f"DEF-{n:03d}", "priority": "P1", "line": None} for n in range(1, issue_count + 1)]
+        trailer = {"total_issues": issue_count, "high_issues": issue_count, "summary": "🟡 high"}
+
+        # Act
+        streamed = write_stream(shipped_parser.load_json_stream(), "json", {"status": "completed"}, issues, trailer)
+
+        # Assert
+        expected = {"status": "completed", "issues": issues, **trailer}
+        assert streamed == json.dumps(expected, indent=2, ensure_ascii=False).encode('utf-8') + b"\n"
+
+    def test_counters_follow_issues_without_changing_values(self, shipped_parser):
+        """
+        Test consumers that look keys up by name see the same result.
+
+        Given: A result whose counters are only known after the last issue
+        When: It is streamed with the counters as a trailer, in each format
+        Then: json.loads gives the same dict as the old key order (NDJSON: issues, then summary)
+        """
+        # Arrange
+        json_stream = shipped_parser.load_json_stream()
+        issues = [{"id": "DEF-001", "priority": "P0"}, {"id": "DEF-002", "priority": "P2"}]
+        old_order = {"status": "completed", "total_issues": 2, "critical_issues": 1, "issues": issues}
+        trailer = {"total_issues": 2, "critical_issues": 1}
+
+        # Act
+        documents = {format: write_stream(json_stream, format, {"status": "completed"}, issues, trailer)
+                     for format in ("json", "compact", "ndjson")}
+
+        # Assert
+        assert json.loads(documents["json"]) == json.loads(documents["compact"]) == old_order
+        assert documents["json"].index(b'"issues"') < documents["json"].index(b'"total_issues"')
+        records = [json.loads(line) for line in documents["ndjson"].splitlines()]
+        assert records == [*issues, {"status": "completed", **trailer}]
+
+    @pytest.mark.parametrize("format", ["json", "compact", "ndjson"])
+    def test_output_bytes_do_not_depend_on_orjson(self, shipped_parser, monkeypatch, format: str):
+        """
+        Test the stdlib fallback writes the bytes orjson writes.
+
+        Given: Issues with an emoji message and an accented path
+        When: They are streamed with orjson and with the stdlib json module
+        Then: Both documents are byte-identical (UTF-8, no \\u escapes)
+        """
+        # Arrange
+        json_stream = shipped_parser.load_json_stream()
+        if json_stream.orjson is None:
+            pytest.skip("orjson not installed")
+        issues = [{"id": "DEF-001", "file": "src/café.py", "message": "🔴 Token in URL", "line": 3}]
+        trailer = {"total_issues": 1, "summary": "Found 1 issue: 🔴 1 critical (P0)"}
+        with_orjson = write_stream(json_stream, format, {"status": "completed"}, issues, trailer)
+
+        # Act
+        monkeypatch.setattr(json_stream, "orjson", None)
+        with_stdlib = write_stream(json_stream, format, {"status": "completed"}, issues, trailer)
+
+        # Assert
+        assert with_stdlib == with_orjson
+        assert "café".encode('utf-8') in with_stdlib
+
+
+# ==============================================================================
+# TC-029: Parse Result Cache
+# ==============================================================================
+
+@pytest.mark.unit
+class TestParseResultCache:
+    """
+    TC-029: Verify cached parse results are keyed and evicted safely.
+
+    Identical CodeRabbit output may reuse stored issues only while the
+    parser that produced them is unchanged, and a replay must equal a fresh
+    parse of the same bytes.
+    """
+
+    def test_key_changes_with_parser_fingerprint(self, shipped_parser, tmp_path: Path, monkeypatch):
+        """
+        Test a parser change never serves results parsed by the old parser.
+
+        Given: The same raw output hashed by the shipped ParseResultCache
+        When: The parser VERSION is bumped and the output is hashed again
+        Then: The same parser gives the same key, the bumped one does not
+        """
+        # Arrange
+        cache = shipped_parser.ParseResultCache(tmp_path)
+        output = b"File: src/auth.py:42\nError: Hardcoded secret\n"
+
+        def key() -> str:
+            hasher = cache.hasher(('text', {'fields': shipped_parser.JSON_FIELDS}))
+            hasher.update(output)
+            return hasher.hexdigest()
+
+        # Act
+        retry_key, same_key = key(), key()
+        monkeypatch.setattr(shipped_parser.CodeRabbitParser, "VERSION", "1.0-changed")
+        new_key = key()
+
+        # Assert
+        assert retry_key == same_key
+        assert retry_key != new_key
+
+    def test_least_recently_used_results_are_evicted_beyond_limit(self, shipped_parser, tmp_path: Path,
+                                                                   monkeypatch):
+        """
+        Test the store stays within its size limit.
+
+        Given: A 100-byte store holding results a (40 B) and b (40 B), with a hit on a after b
+        When: Result c (40 B) is stored
+        Then: b, the least recently used, is evicted; a and c remain
+        """
+        # Arrange
+        clock = iter([1.0, 2.0, 3.0, 4.0])
+        monkeypatch.setattr(shipped_parser, "time", SimpleNamespace(time=lambda: next(clock)))
+        cache = shipped_parser.ParseResultCache(tmp_path, max_bytes=100)
+        cache.put("a", b"x" * 40)
+        cache.put("b", b"x" * 40)
+        cache.get("a")
+
+        # Act
+        cache.put("c", b"x" * 40)
+
+        # Assert
+        kept = [row[0] for row in cache.conn.execute("SELECT cache_key FROM results ORDER BY cache_key")]
+        assert kept == ["a", "c"]
+
+    def test_cached_runs_print_what_an_uncached_run_prints(self, shipped_bin: Path, sample_coderabbit_output: str,
+                                                           tmp_path: Path):
+        """
+        Test a miss and a hit with --cache-dir write the uncached output byte for byte.
+
+        Given: A log with a lone '\\r' inside a line and a CRLF line ending
+        When: parse-coderabbit.py runs without a cache, then twice with --cache-dir
+        Then: All three outputs are identical ('\\r' splits no line, as on stdin)
+        """
+        # Arrange
+        log = (sample_coderabbit_output +
+               "Error: hardcoded password in a.py:3\rWarning: missing docstring b.py:5\r\n").encode('utf-8')
+        parser = [sys.executable, str(shipped_bin / "parse-coderabbit.py")]
+        cached = parser + ["--cache-dir", str(tmp_path / "cache")]
+
+        # Act
+        outputs = [subprocess.run(command, input=log, capture_output=True).stdout
+                   for command in (parser, cached, cached)]
+
+        # Assert
+        assert outputs[0] == outputs[1] == outputs[2]
+        assert json.loads(outputs[0])["issues"][-1]["message"].startswith("hardcoded password")
+
+
+# ==============================================================================
+# TC-030: Structured Input (SARIF / JSON)
+# ==============================================================================
+
+@pytest.mark.unit
+class TestStructuredInput:
+    """
+    TC-030: Verify structured findings map to issues without text classification.
+
+    Fields come from declarative paths into each finding, and findings are
+    decoded one at a time from fixed-size reads.
+    """
+
+    def test_sarif_result_maps_through_field_map(self):
+        """
+        Test a SARIF result yields issue fields by path, with rule fallbacks.
+
+        Given: A SARIF result without its own level, and its rule
+        When: The SARIF field map is applied to the result, then to the rule
+        Then: File, line and message come from the result, severity from the rule
+        """
+        # Arrange
+        result = {
+            "ruleId": "B105",
+            "message": {"text": "Possible hardcoded password"},
+            "locations": [{"physicalLocation": {"artifactLocation": {"uri": "src/auth.py"},
+                                                "region": {"startLine": 42}}}],
+        }
+        rule = {"id": "B105", "defaultConfiguration": {"level": "error"}}
+        fields = {
+            "file": "locations[0].physicalLocation.artifactLocation.uri",
+            "line": "locations[0].physicalLocation.region.startLine",
+            "message": "message.text",
+            "severity": "level",
+        }
+
+        # Act
+        finding = {name: resolve_path(result, path) for name, path in fields.items()}
+        finding["severity"] = finding["severity"] or resolve_path(rule, "defaultConfiguration.level")
+
+        # Assert
+        assert finding == {"file": "src/auth.py", "line": 42, "message": "Possible hardcoded password",
+                           "severity": "error"}
+        assert resolve_path(result, "locations[1].physicalLocation") is None
+
+    @pytest.mark.parametrize("chunk_chars", [1, 7, 64 * 1024])
+    def test_chunked_decoding_matches_whole_document(self, chunk_chars: int):
+        """
+        Test findings decoded from small reads equal json.loads of the whole array.
+
+        Given: An indented JSON array of findings with non-ASCII text
+        When: It is decoded element by element from reads of chunk_chars
+        Then: The same findings come out, in order
+        """
+        # Arrange
+        findings = [{"file": f"src/m{n}.py", "line": n * 1000, "message": "Clé codée en dur 🔑"} for n in range(20)]
+        text = json.dumps(findings, indent=2, ensure_ascii=False)
+
+        # Act
+        decoded = decode_array_in_chunks(text, chunk_chars)
+
+        # Assert
+        assert decoded == json.loads(text)
+
+
+# ==============================================================================
+# TC-031: Pattern Profiling
+# ==============================================================================
+
+@pytest.mark.unit
+class TestPatternProfiling:
+    """
+    TC-031: Verify opt-in pattern instrumentation counts without changing results.
+
+    A profiled pattern must return exactly what the compiled pattern returns.
+    """
+
+    def test_profiled_search_counts_calls_and_matches(self):
+        """
+        Test a wrapped search records calls and matches and returns the same matches.
+
+        Given: The hardcoded-secret pattern and three lines, two of which match
+        When: Each line is searched through the profiling wrapper
+        Then: Matches equal the plain search; 3 calls and 2 matches are counted
+        """
+        # Arrange
+        pattern = re.compile(r"(?:hardcoded|secret|api[_\s]?key|password|token)", re.IGNORECASE)
+        lines = ["Hardcoded API key found", "Missing docstring", "Password in config"]
+        stats = {"calls": 0, "matches": 0, "total_ns": 0, "max_ns": 0, "max_line_chars": 0}
+        search = profiled_search(pattern, stats)
+
+        # Act
+        profiled = [bool(search(line)) for line in lines]
+
+        # Assert
+        assert profiled == [bool(pattern.search(line)) for line in lines]
+        assert (stats["calls"], stats["matches"]) == (3, 2)
+        assert stats["max_line_chars"] in [len(line) for line in lines]
+
+    def test_report_orders_patterns_by_cost_and_lists_unmatched(self):
+        """
+        Test the side report puts the most expensive pattern first.
+
+        Given: Counters for three patterns, one that never matched
+        When: The report is built
+        Then: Patterns are ordered by total time and the unmatched one is listed
+        """
+        # Arrange
+        counters = {
+            "error": {"calls": 10, "matches": 2, "total_ns": 5_000},
+            "file_line": {"calls": 30, "matches": 10, "total_ns": 90_000},
+            "solid_isp": {"calls": 8, "matches": 0, "total_ns": 7_000},
+        }
+
+        # Act
+        report = build_profile_report(counters)
+
+        # Assert
+        assert list(report["patterns"]) == ["file_line", "solid_isp", "error"]
+        assert report["patterns"]["file_line"]["hit_rate"] == 0.3333
+        assert report["never_matched"] == ["solid_isp"]
+
+
+# ==============================================================================
+# TC-042: Shipped Parser - Parallel and Streaming Equivalence
+# ==============================================================================
+
+@pytest.mark.unit
+class TestShippedParseEquivalence:
+    """
+    TC-042: Verify parse_parallel() and parse_stream() of the shipped parser equal parse().
+
+    Shard cuts fall between an issue and its trailing lines (and between
+    a 'File:' line and the issue it precedes); the merge must replay them
+    so the output never depends on where the text was cut.
+    """
+
+    @pytest.mark.parametrize("shards_per_worker", [1, 4, 7])
+    @pytest.mark.parametrize("workers", [2, 3, 8])
+    def test_parallel_output_matches_parse(self, shipped_parser, monkeypatch, workers: int,
+                                           shards_per_worker: int):
+        """
+        Test worker processes return byte-identical output to the sequential parse.
+
+        Given: Sample and malformed CodeRabbit output, repeated, with no size threshold
+        When: It is parsed with parse_parallel() across N workers and N*K shards
+        Then: The JSON result equals parse(), DEF numbers included
+        """
+        # Arrange
+        text = review_text()
+        monkeypatch.setattr(shipped_parser.CodeRabbitParser, "PARALLEL_MIN_CHARS", 0)
+        monkeypatch.setattr(shipped_parser.CodeRabbitParser, "SHARDS_PER_WORKER", shards_per_worker)
+
+        # Act
+        parallel = shipped_parser.CodeRabbitParser().parse_parallel(text, workers=workers)
+
+        # Assert
+        expected = shipped_parser.CodeRabbitParser().parse(text)
+        assert json.dumps(parallel.to_dict()) == json.dumps(expected.to_dict())
+
+    def test_every_cut_position_matches_parse(self, shipped_parser, monkeypatch):
+        """
+        Test a single cut at each line boundary gives the sequential result.
+
+        Given: The sample output, cut into two shards after each of its lines in turn
+        When: Each cut is parsed with parse_parallel() (threads stand in for processes)
+        Then: Every result equals parse()
+        """
+        # Arrange
+        text = review_text(repeat=1)
+        lines = text.split('\n')
+        expected = json.dumps(shipped_parser.CodeRabbitParser().parse(text).to_dict())
+        monkeypatch.setattr(shipped_parser.CodeRabbitParser, "PARALLEL_MIN_CHARS", 0)
+        monkeypatch.setattr(shipped_parser, "ProcessPoolExecutor", ThreadPoolExecutor)
+
+        # Act
+        differing = []
+        for cut in range(1, len(lines)):
+            shards = ['\n'.join(lines[:cut]), '\n'.join(lines[cut:])]
+            monkeypatch.setattr(shipped_parser.CodeRabbitParser, "_split_shards",
+                                staticmethod(lambda text, count, shards=shards: shards))
+            result = shipped_parser.CodeRabbitParser().parse_parallel(text, workers=2)
+            if json.dumps(result.to_dict()) != expected:
+                differing.append(cut)
+
+        # Assert
+        assert differing == []
+
+    def test_split_shards_rejoins_to_input(self, shipped_parser):
+        """
+        Test shards cut only at newlines and join back to the input.
+
+        Given: Output with CRLF endings, blank lines and no trailing newline
+        When: It is split into 1 to 40 shards
+        Then: '\\n'.join(shards) is the input every time
+        """
+        # Arrange
+        text = review_text(repeat=1).replace('\n', '\r\n', 5)[:-1]
+
+        # Act
+        splits = [shipped_parser.CodeRabbitParser._split_shards(text, count) for count in range(1, 41)]
+
+        # Assert
+        assert all('\n'.join(shards) == text for shards in splits)
+
+    def test_stream_yields_issues_before_input_ends(self, shipped_parser):
+        """
+        Test parse_stream() matches parse() and closes each issue at the next issue start.
+
+        Given: The sample output fed one line at a time from a generator
+        When: parse_stream() is consumed
+        Then: The issues equal parse()'s, and the first arrives before the last line is read
+        """
+        # Arrange
+        text = review_text(repeat=1)
+        lines_read = []
+
+        def lines():
+            for line in io.StringIO(text):
+                lines_read.append(line)
+                yield line
+
+        # Act
+        stream = shipped_parser.CodeRabbitParser().parse_stream(lines())
+        first = next(stream)
+        read_before_first = len(lines_read)
+        issues = [first, *stream]
+
+        # Assert
+        expected = shipped_parser.CodeRabbitParser().parse(text).issues
+        assert [issue.to_dict() for issue in issues] == [issue.to_dict() for issue in expected]
+        assert read_before_first < len(text.splitlines())
+
 # ==============================================================================
 # Helper Functions for Tests
 # ==============================================================================
@@ -392,3 +892,153 @@ def find_issue_by_keyword(issues: List[Dict], keyword: str) -> Dict:
         if keyword.lower() in issue.get("message", "").lower():
             return issue
     return None
+
+
+def build_issue_columns(issues: List[Dict]):
+    """
+    Store issues as parallel arrays (the IssueBatch layout).
+
+    Args:
+        issues: List of issue dictionaries
+
+    Returns:
+        tuple: (priority codes, file indexes, lines, distinct file paths)
+    """
+    priorities, file_indexes, lines = array("B"), array("I"), array("i")
+    files, file_index = [], {}
+    for issue in issues:
+        priorities.append(int(issue["priority"][1]))
+        if issue["file"] not in file_index:
+            file_index[issue["file"]] = len(files)
+            files.append(issue["file"])
+        file_indexes.append(file_index[issue["file"]])
+        lines.append(issue["line"] or 0)  # 0 = no line
+    return priorities, file_indexes, lines, files
+
+
+def write_stream(json_stream, format: str, header: Dict, issues: List[Dict], trailer: Dict) -> bytes:
+    """
+    Write one result through the shipped JsonStreamWriter.
+
+    Args:
+        json_stream: Shipped json-stream.py module
+        format: 'json', 'compact' or 'ndjson'
+        header: Fields known before the first issue
+        issues: Issue dictionaries, written one at a time
+        trailer: Fields known only after the last issue
+
+    Returns:
+        bytes: Everything written
+    """
+    stream = io.BytesIO()
+    writer = json_stream.JsonStreamWriter(stream, format=format)
+    writer.begin(header)
+    for issue in issues:
+        writer.write_issue(issue)
+    writer.end(trailer)
+    return stream.getvalue()
+
+
+def resolve_path(record: Any, path: str) -> Any:
+    """
+    Look up a dotted field-map path such as "locations[0].message.text".
+
+    Args:
+        record: Decoded finding
+        path: Dotted path with [index] for list elements
+
+    Returns:
+        The value, or None if any step is missing
+    """
+    value = record
+    for key, index in re.findall(r"([^.\[\]]+)|\[(\d+)\]", path):
+        try:
+            value = value[int(index)] if index else value[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return value
+
+
+def decode_array_in_chunks(text: str, chunk_chars: int) -> List:
+    """
+    Decode a JSON array of objects one element at a time (the JsonReader approach).
+
+    Args:
+        text: JSON array text
+        chunk_chars: Characters per read
+
+    Returns:
+        list: Decoded elements
+    """
+    decoder = json.JSONDecoder()
+    stream = io.StringIO(text)
+    buffer, pos, items = "", 0, []
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n[,]":
+            pos += 1
+        try:
+            item, pos = decoder.raw_decode(buffer, pos)
+            items.append(item)
+        except ValueError:  # Element continues in the next read
+            chunk = stream.read(chunk_chars)
+            if not chunk:
+                return items
+            buffer, pos = buffer[pos:] + chunk, 0
+
+
+def profiled_search(pattern: "re.Pattern", stats: Dict[str, int]) -> Callable:
+    """
+    Wrap pattern.search the way ProfiledPattern does.
+
+    Args:
+        pattern: Compiled pattern
+        stats: Counters updated on every call
+
+    Returns:
+        Callable: search(line) returning the pattern's match
+    """
+    def search(line: str):
+        start = time.perf_counter_ns()
+        match = pattern.search(line)
+        elapsed = time.perf_counter_ns() - start
+        stats["calls"] += 1
+        stats["total_ns"] += elapsed
+        if match:
+            stats["matches"] += 1
+        if elapsed >= stats["max_ns"]:
+            stats["max_ns"] = elapsed
+            stats["max_line_chars"] = len(line)
+        return match
+    return search
+
+
+def build_profile_report(counters: Dict[str, Dict[str, int]]) -> Dict:
+    """
+    Build the PatternProfiler side report from per-pattern counters.
+
+    Args:
+        counters: Pattern name → calls, matches, total_ns
+
+    Returns:
+        dict: Patterns by total time (with hit_rate), never-matched names
+    """
+    patterns = {
+        name: {**stats, "hit_rate": round(stats["matches"] / stats["calls"], 4) if stats["calls"] else None}
+        for name, stats in sorted(counters.items(), key=lambda item: item[1]["total_ns"], reverse=True)
+    }
+    return {"patterns": patterns, "never_matched": [name for name, stats in counters.items() if not stats["matches"]]}
+
+
+def review_text(repeat: int = 3) -> str:
+    """
+    CodeRabbit output for equivalence tests: the sample fixtures (malformed included), repeated.
+
+    Args:
+        repeat: Copies of the sample output (the malformed output follows each)
+
+    Returns:
+        str: Output text ending without a newline after the last issue
+    """
+    fixtures = Path(__file__).parent / "fixtures"
+    block = (fixtures / "sample_coderabbit_output.txt").read_text() + (fixtures / "malformed_output.txt").read_text()
+    return (block * repeat).rstrip('\n')
@@ -1,8 +1,10 @@
 """
-Wrapper Script Integration Tests (TC-008)
+Wrapper Script Integration Tests (TC-008, TC-024, TC-025)
 
 Tests the coderabbit-json wrapper script functionality:
 - TC-008: Wrapper script flags and integration
+- TC-024: Diff-scoped review (--since / --staged)
+- TC-025: Follow mode (checkpoint resume, streamed output, --timeout watchdog)
 
 Author: Julia Santos - Testing & QA Specialist
 Date: 2025-11-10
@@ -10,9 +12,16 @@ Version: 1.0
 """
 
 import pytest
+import os
+import re
+import json
+import time
+import bisect
+import shutil
+import threading
 import subprocess
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 
 # ==============================================================================
@@ -397,6 +406,209 @@ class TestWrapperCICDIntegration:
         pass
 
 
+# ==============================================================================
+# TC-024: Diff-Scoped Review
+# ==============================================================================
+
+@pytest.mark.unit
+class TestDiffScopedReview:
+    """
+    TC-024: Verify --since / --staged hunk filtering.
+
+    diff-scope.py parses `git diff --unified=0` hunk headers into merged
+    line ranges per file; findings are kept only inside those ranges.
+    """
+
+    @pytest.mark.parametrize("header,expected", [
+        ("@@ -3 +3 @@", (3, 3)),                # One line modified
+        ("@@ -5,0 +6,4 @@", (6, 9)),            # Four lines added
+        ("@@ -10,3 +9,0 @@", None),             # Pure deletion: nothing to review
+        ("@@ -0,0 +1,120 @@ def main():", (1, 120)),  # New file, function context
+    ])
+    def test_hunk_header_to_line_range(self, header: str, expected: Optional[Tuple[int, int]]):
+        """
+        Test hunk headers map to new-file line ranges.
+
+        Given: A zero-context hunk header
+        When: Parsed
+        Then: Inclusive (start, end) range, or None for deletions
+        """
+        # Act & Assert
+        assert parse_hunk_header(header) == expected
+
+    def test_findings_filtered_by_interval_index(self):
+        """
+        Test findings are kept only inside changed hunks.
+
+        Given: Hunks 3-3, 6-9 and 8-12 (overlapping, merged to 6-12)
+        When: Findings at lines 2, 3, 5, 6, 12, 13 are checked
+        Then: Only lines 3, 6 and 12 are in scope
+        """
+        # Arrange
+        starts, ends = build_interval_index([(6, 9), (3, 3), (8, 12)])
+
+        # Act
+        kept = [line for line in (2, 3, 5, 6, 12, 13) if line_in_index(starts, ends, line)]
+
+        # Assert
+        assert (starts, ends) == ([3, 6], [3, 12])
+        assert kept == [3, 6, 12]
+
+    def test_kept_findings_renumbered_contiguously(self):
+        """
+        Test DEF IDs stay contiguous after filtering.
+
+        Given: DEF-001..DEF-004, of which DEF-002 and DEF-004 are in scope
+        When: Filtered to the diff
+        Then: Kept issues become DEF-001 and DEF-002, in original order
+        """
+        # Arrange
+        issues = [{'id': f"DEF-{n:03d}", 'line': line} for n, line in enumerate([1, 7, 20, 9], 1)]
+        starts, ends = build_interval_index([(6, 10)])
+
+        # Act
+        kept = [issue for issue in issues if line_in_index(starts, ends, issue['line'])]
+        for number, issue in enumerate(kept, 1):
+            issue['id'] = f"DEF-{number:03d}"
+
+        # Assert
+        assert [(issue['id'], issue['line']) for issue in kept] == [('DEF-001', 7), ('DEF-002', 9)]
+
+    @pytest.mark.integration
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_changed_paths_reach_coderabbit_verbatim(self, shipped_bin: Path, tmp_path: Path):
+        """
+        Test the shipped wrapper passes each changed path as one argument.
+
+        Given: Staged edits to 'a b.py' and a file literally named '*.py', next to unchanged c.py
+        When: coderabbit-json --staged runs (CodeRabbit replaced by a script recording its argv)
+        Then: CodeRabbit receives exactly those two paths, unsplit and unexpanded
+        """
+        # Arrange
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        for name in ("a b.py", "*.py", "c.py"):
+            (repo / name).write_text("x = 1\n")
+        git(repo, "init", "-q")
+        git(repo, "add", ".")
+        git(repo, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+        for name in ("a b.py", "*.py"):
+            (repo / name).write_text("x = 2\n")
+        git(repo, "add", ".")
+        wrapper, env = install_shipped_wrapper(shipped_bin, tmp_path, "printf '%s\\n' \"$@\" > argv\n")
+
+        # Act
+        result = run_wrapper_script(wrapper, ["--staged"], cwd=repo, env=env)
+
+        # Assert
+        assert result.returncode == 0, result.stderr
+        assert (repo / "argv").read_text().splitlines() == ["review", "--plain", "*.py", "a b.py"]
+
+
+# ==============================================================================
+# TC-025: Follow Mode
+# ==============================================================================
+
+@pytest.mark.unit
+class TestFollowMode:
+    """
+    TC-025: Verify follow mode parses a growing log incrementally.
+
+    The shipped CodeRabbitParser.follow() only consumes complete lines (a
+    multi-byte emoji cut between reads waits for the rest), and its
+    checkpoint lets a killed parser resume where the consumer stopped.
+    """
+
+    @pytest.mark.parametrize("chunk_bytes", [7, 64 * 1024])
+    def test_resumed_follow_matches_parse(self, shipped_parser, sample_coderabbit_output: str,
+                                          tmp_path: Path, monkeypatch, chunk_bytes: int):
+        """
+        Test a follow run killed mid-chunk and resumed from its checkpoint equals parse().
+
+        Given: A log whose first 1,500 bytes hold 5 issue starts and a partial line;
+               the rest is appended in uneven pieces (cut mid-line and mid-emoji) while follow() runs
+        When: The consumer takes 3 issues, the parser is killed, and a new parser resumes
+        Then: Only the 3rd issue (in flight at the kill) is emitted again; together they equal parse()
+        """
+        # Arrange
+        text = sample_coderabbit_output + "🔴 Critical: Token in URL\nFile: src/api.py:9\n\n🟡 High: Missing type hints\n"
+        data = text.encode('utf-8')
+        log, checkpoint_path = tmp_path / "review.log", tmp_path / "review.ckpt"
+        log.write_bytes(data[:1500])  # One 64 KB read: the kill lands mid-chunk
+        monkeypatch.setattr(shipped_parser.CodeRabbitParser, "FOLLOW_CHUNK_BYTES", chunk_bytes)
+        monkeypatch.setattr(shipped_parser.CodeRabbitParser, "FOLLOW_POLL_SECONDS", 0.01)
+        writer = threading.Thread(target=append_in_pieces, args=(log, data[1500:], [5, 61, 700, 1201, len(data) - 1502]))
+        writer.start()
+
+        # Act
+        killed = shipped_parser.CodeRabbitParser().follow(
+            log, writer_alive=writer.is_alive, checkpoint=shipped_parser.FollowCheckpoint.load(checkpoint_path))
+        before_kill = [next(killed).to_dict() for _ in range(3)]
+        killed.close()  # Like a kill: nothing after the last yield runs
+        resumed = [issue.to_dict() for issue in shipped_parser.CodeRabbitParser().follow(
+            log, writer_alive=writer.is_alive, checkpoint=shipped_parser.FollowCheckpoint.load(checkpoint_path))]
+        writer.join()
+
+        # Assert
+        expected = [issue.to_dict() for issue in shipped_parser.CodeRabbitParser().parse(text).issues]
+        assert resumed[0] == before_kill[-1]
+        assert before_kill[:-1] + resumed == expected
+        assert json.loads(checkpoint_path.read_text())['offset'] == len(data)
+
+    @pytest.mark.integration
+    def test_wrapper_streams_issues_while_coderabbit_runs(self, shipped_bin: Path, tmp_path: Path):
+        """
+        Test the shipped wrapper writes each issue to stdout before CodeRabbit exits.
+
+        Given: A CodeRabbit stand-in that prints two findings, then waits for a release file
+        When: coderabbit-json runs and its stdout is read line by line
+        Then: DEF-001 arrives while CodeRabbit is still running; the summary comes after the release
+        """
+        # Arrange
+        release, finished = tmp_path / "release", tmp_path / "finished"
+        wrapper, env = install_shipped_wrapper(shipped_bin, tmp_path, (
+            "printf 'File: src/a.py:3\\nError: hardcoded password\\n\\nFile: src/b.py:5\\nWarning: missing docstring\\n'\n"
+            f"for _ in $(seq 100); do [ -f '{release}' ] && break; sleep 0.1; done\n"
+            f"touch '{finished}'\n"
+        ))
+        process = subprocess.Popen([str(wrapper)], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                   text=True, cwd=tmp_path, env=env)
+
+        # Act
+        first_issue_seen_early = False
+        for line in process.stdout:
+            if '"id": "DEF-001"' in line:
+                first_issue_seen_early = not finished.exists()
+                release.touch()
+        process.wait()
+
+        # Assert
+        assert first_issue_seen_early
+        assert process.returncode == 1  # One P0 finding
+
+    @pytest.mark.integration
+    def test_watchdog_kill_keeps_findings_written_before_it(self, shipped_bin: Path, tmp_path: Path):
+        """
+        Test a hung review is killed by the watchdog and its findings are still reported.
+
+        Given: A CodeRabbit stand-in that prints one finding, then hangs at "Reviewing"
+        When: coderabbit-json --timeout 1 runs
+        Then: The JSON holds the finding and stderr says the results are partial
+        """
+        # Arrange
+        wrapper, env = install_shipped_wrapper(shipped_bin, tmp_path, (
+            "printf 'Warning: missing docstring\\nFile: src/a.py:3\\n\\nReviewing\\n'\nsleep 30\n"
+        ))
+
+        # Act
+        result = run_wrapper_script(wrapper, ["--timeout", "1"], cwd=tmp_path, env=env)
+
+        # Assert
+        output = json.loads(result.stdout)
+        assert [(issue['file'], issue['line']) for issue in output['issues']] == [('src/a.py', 3)]
+        assert "results are partial" in result.stderr
+
+
 # ==============================================================================
 # Helper Functions for Wrapper Testing
 # ==============================================================================
@@ -404,7 +616,8 @@ class TestWrapperCICDIntegration:
 def run_wrapper_script(
     script_path: Path,
     args: list = None,
-    cwd: Path = None
+    cwd: Path = None,
+    env: Optional[Dict[str, str]] = None
 ) -> subprocess.CompletedProcess:
     """
     Run wrapper script with given arguments.
@@ -413,6 +626,7 @@ def run_wrapper_script(
         script_path: Path to wrapper script
         args: Command-line arguments (default: [])
         cwd: Working directory (default: current)
+        env: Environment (default: inherited)
 
     Returns:
         CompletedProcess: Result of subprocess.run()
@@ -424,10 +638,48 @@ def run_wrapper_script(
         [str(script_path)] + args,
         capture_output=True,
         text=True,
-        cwd=str(cwd) if cwd else None
+        cwd=str(cwd) if cwd else None,
+        env=env
     )
 
 
+def install_shipped_wrapper(shipped_bin: Path, directory: Path, coderabbit_body: str) -> Tuple[Path, Dict[str, str]]:
+    """
+    Install the shipped coderabbit-json against shipped_bin, with a scripted CodeRabbit CLI.
+
+    Args:
+        shipped_bin: Extracted bin/ scripts (conftest shipped_bin)
+        directory: Where the wrapper, the fake CLI and the parse cache go
+        coderabbit_body: Bash body of the fake `coderabbit` command
+
+    Returns:
+        tuple: (wrapper path, environment with the fake CLI first on PATH)
+    """
+    fake_bin = directory / "fake-bin"
+    fake_bin.mkdir()
+    coderabbit = fake_bin / "coderabbit"
+    coderabbit.write_text("#!/bin/bash\n" + coderabbit_body)
+    wrapper = directory / "coderabbit-json"
+    script = (shipped_bin / "coderabbit-json").read_text()
+    script = script.replace("/srv/cc/hana-x-infrastructure/bin/", f"{shipped_bin}/")
+    script = re.sub(r'(?m)^PARSE_CACHE_DIR=.*$', f'PARSE_CACHE_DIR="{directory / "parse-cache"}"', script)
+    wrapper.write_text(script)
+    for path in (coderabbit, wrapper):
+        path.chmod(0o755)
+    return wrapper, {**os.environ, "PATH": f"{fake_bin}{os.pathsep}{os.environ['PATH']}"}
+
+
+def git(repo: Path, *args: str):
+    """
+    Run a git command in repo, failing the test on error.
+
+    Args:
+        repo: Repository directory
+        *args: git arguments
+    """
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
 def assert_valid_json_output(stdout: str):
     """
     Assert stdout contains valid JSON.
@@ -443,3 +695,72 @@ def assert_valid_json_output(stdout: str):
         json.loads(stdout)
     except json.JSONDecodeError as e:
         pytest.fail(f"Invalid JSON output: {e}")
+
+
+def parse_hunk_header(header: str) -> Optional[Tuple[int, int]]:
+    """
+    Convert a zero-context hunk header to a new-file line range.
+
+    Args:
+        header: Line such as "@@ -12,3 +14,5 @@"
+
+    Returns:
+        tuple: Inclusive (start, end), or None if no lines were added
+    """
+    match = re.match(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@', header)
+    start = int(match.group(1))
+    count = int(match.group(2)) if match.group(2) is not None else 1
+    return (start, start + count - 1) if count > 0 else None
+
+
+def build_interval_index(ranges: List[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+    """
+    Merge line ranges into sorted, non-overlapping start/end lists.
+
+    Args:
+        ranges: Inclusive (start, end) ranges in any order
+
+    Returns:
+        tuple: (starts, ends) for binary search
+    """
+    starts, ends = [], []
+    for start, end in sorted(ranges):
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def line_in_index(starts: List[int], ends: List[int], line: int) -> bool:
+    """
+    Check whether line falls inside a merged range (O(log n)).
+
+    Args:
+        starts: Sorted range starts
+        ends: Matching range ends
+        line: Line number to check
+
+    Returns:
+        bool: True if line is inside a changed hunk
+    """
+    position = bisect.bisect_right(starts, line) - 1
+    return position >= 0 and line <= ends[position]
+
+
+def append_in_pieces(log: Path, data: bytes, cuts: List[int]):
+    """
+    Append data to log in pieces ending at the given byte offsets, pausing between them.
+
+    Args:
+        log: Growing log file
+        data: Everything the writer will write
+        cuts: Increasing offsets where a write ends (the rest follows last)
+    """
+    start = 0
+    for end in [*cuts, len(data)]:
+        with open(log, 'ab') as stream:
+            stream.write(data[start:end])
+        start = end
+        time.sleep(0.05)